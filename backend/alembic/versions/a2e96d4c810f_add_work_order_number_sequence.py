@@ -0,0 +1,38 @@
+"""Add work order number sequence
+
+Revision ID: a2e96d4c810f
+Revises: f8c15a2d7b94
+Create Date: 2025-08-30 14:19:46.902133
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2e96d4c810f'
+down_revision: Union[str, None] = 'f8c15a2d7b94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE IF NOT EXISTS work_order_number_seq START WITH 1001")
+    # Advance past the highest existing numeric suffix so new numbers
+    # cannot collide with orders created before the sequence existed
+    op.execute("""
+        SELECT setval(
+            'work_order_number_seq',
+            GREATEST(1001, COALESCE((
+                SELECT MAX((substring(order_number from '[0-9]+$'))::bigint)
+                FROM work_orders
+                WHERE order_number ~ '[0-9]+$'
+            ), 1000) + 1),
+            false
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP SEQUENCE IF EXISTS work_order_number_seq")
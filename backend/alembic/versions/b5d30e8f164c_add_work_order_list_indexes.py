@@ -0,0 +1,35 @@
+"""Add work order list-filter indexes
+
+Revision ID: b5d30e8f164c
+Revises: a2e96d4c810f
+Create Date: 2025-08-30 14:52:23.417689
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d30e8f164c'
+down_revision: Union[str, None] = 'a2e96d4c810f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_wo_status_created_at',
+        'work_orders',
+        ['status', 'created_at'],
+    )
+    op.create_index(
+        'ix_wo_client_created_at',
+        'work_orders',
+        ['client_id', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_wo_client_created_at', table_name='work_orders')
+    op.drop_index('ix_wo_status_created_at', table_name='work_orders')
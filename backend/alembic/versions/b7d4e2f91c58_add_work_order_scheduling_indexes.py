@@ -0,0 +1,36 @@
+"""Add work order scheduling indexes
+
+Revision ID: b7d4e2f91c58
+Revises: 3468209c0a61
+Create Date: 2025-08-30 10:12:44.531208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d4e2f91c58'
+down_revision: Union[str, None] = '3468209c0a61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_wo_tech_schedule',
+        'work_orders',
+        ['assigned_technician_id', 'scheduled_start', 'scheduled_end'],
+    )
+    op.create_index(
+        'ix_wo_active_schedule',
+        'work_orders',
+        ['scheduled_start'],
+        postgresql_where=sa.text("status IN ('pending', 'scheduled', 'in_progress')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_wo_active_schedule', table_name='work_orders')
+    op.drop_index('ix_wo_tech_schedule', table_name='work_orders')
@@ -0,0 +1,30 @@
+"""Add technician skills GIN index
+
+Revision ID: c3a81f6d2e09
+Revises: b7d4e2f91c58
+Create Date: 2025-08-30 11:02:17.845623
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a81f6d2e09'
+down_revision: Union[str, None] = 'b7d4e2f91c58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_technicians_skills',
+        'technicians',
+        ['skills'],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_technicians_skills', table_name='technicians')
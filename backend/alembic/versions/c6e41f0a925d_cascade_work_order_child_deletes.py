@@ -0,0 +1,51 @@
+"""Cascade work order child deletes server-side
+
+Revision ID: c6e41f0a925d
+Revises: b5d30e8f164c
+Create Date: 2025-08-30 15:10:37.558204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e41f0a925d'
+down_revision: Union[str, None] = 'b5d30e8f164c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_CHILD_TABLES = (
+    'work_order_services',
+    'work_order_items',
+    'work_order_notes',
+    'work_order_status_history',
+)
+
+
+def upgrade() -> None:
+    for table in _CHILD_TABLES:
+        constraint = f'{table}_work_order_id_fkey'
+        op.drop_constraint(constraint, table, type_='foreignkey')
+        op.create_foreign_key(
+            constraint,
+            table,
+            'work_orders',
+            ['work_order_id'],
+            ['id'],
+            ondelete='CASCADE',
+        )
+
+
+def downgrade() -> None:
+    for table in _CHILD_TABLES:
+        constraint = f'{table}_work_order_id_fkey'
+        op.drop_constraint(constraint, table, type_='foreignkey')
+        op.create_foreign_key(
+            constraint,
+            table,
+            'work_orders',
+            ['work_order_id'],
+            ['id'],
+        )
@@ -0,0 +1,54 @@
+"""Write work order status history from a trigger
+
+Revision ID: d7b52e9c403f
+Revises: c6e41f0a925d
+Create Date: 2025-08-30 16:03:12.871542
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b52e9c403f'
+down_revision: Union[str, None] = 'c6e41f0a925d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # History rows are written server-side on every status change, so
+    # the application no longer issues a second INSERT per transition
+    # and history cannot be skipped by non-ORM writers. Custom notes
+    # travel through the transaction-local app.status_notes setting.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION wo_status_history_tg() RETURNS trigger AS $$
+        BEGIN
+            IF OLD.status IS DISTINCT FROM NEW.status THEN
+                INSERT INTO work_order_status_history
+                    (id, work_order_id, previous_status, new_status, changed_by, notes, created_at)
+                VALUES (
+                    gen_random_uuid(),
+                    NEW.id,
+                    OLD.status,
+                    NEW.status,
+                    COALESCE(NEW.updated_by, NEW.created_by),
+                    COALESCE(NULLIF(current_setting('app.status_notes', true), ''), 'Status updated'),
+                    now()
+                );
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER wo_status_history
+        AFTER UPDATE OF status ON work_orders
+        FOR EACH ROW EXECUTE FUNCTION wo_status_history_tg()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS wo_status_history ON work_orders")
+    op.execute("DROP FUNCTION IF EXISTS wo_status_history_tg()")
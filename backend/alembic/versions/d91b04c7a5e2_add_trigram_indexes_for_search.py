@@ -0,0 +1,58 @@
+"""Add trigram indexes for technician search
+
+Revision ID: d91b04c7a5e2
+Revises: c3a81f6d2e09
+Create Date: 2025-08-30 11:41:52.190377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91b04c7a5e2'
+down_revision: Union[str, None] = 'c3a81f6d2e09'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # pg_trgm lets GIN indexes serve leading-wildcard ILIKE lookups,
+    # which otherwise force sequential scans on users/technicians
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_users_first_name_trgm',
+        'users',
+        ['first_name'],
+        postgresql_using='gin',
+        postgresql_ops={'first_name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_users_last_name_trgm',
+        'users',
+        ['last_name'],
+        postgresql_using='gin',
+        postgresql_ops={'last_name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_users_email_trgm',
+        'users',
+        ['email'],
+        postgresql_using='gin',
+        postgresql_ops={'email': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_technicians_employee_id_trgm',
+        'technicians',
+        ['employee_id'],
+        postgresql_using='gin',
+        postgresql_ops={'employee_id': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_technicians_employee_id_trgm', table_name='technicians')
+    op.drop_index('ix_users_email_trgm', table_name='users')
+    op.drop_index('ix_users_last_name_trgm', table_name='users')
+    op.drop_index('ix_users_first_name_trgm', table_name='users')
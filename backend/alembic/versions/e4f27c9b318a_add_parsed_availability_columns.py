@@ -0,0 +1,27 @@
+"""Add parsed availability columns to technicians
+
+Revision ID: e4f27c9b318a
+Revises: d91b04c7a5e2
+Create Date: 2025-08-30 12:28:09.664815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4f27c9b318a'
+down_revision: Union[str, None] = 'd91b04c7a5e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('technicians', sa.Column('workdays_mask', sa.SmallInteger(), nullable=True))
+    op.add_column('technicians', sa.Column('hours_per_day', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('technicians', 'hours_per_day')
+    op.drop_column('technicians', 'workdays_mask')
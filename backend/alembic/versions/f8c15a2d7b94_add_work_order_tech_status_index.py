@@ -0,0 +1,30 @@
+"""Add partial technician/status index on work orders
+
+Revision ID: f8c15a2d7b94
+Revises: e4f27c9b318a
+Create Date: 2025-08-30 13:05:31.278446
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8c15a2d7b94'
+down_revision: Union[str, None] = 'e4f27c9b318a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_wo_tech_status',
+        'work_orders',
+        ['assigned_technician_id', 'status'],
+        postgresql_where=sa.text("status IN ('pending', 'scheduled', 'in_progress')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_wo_tech_status', table_name='work_orders')
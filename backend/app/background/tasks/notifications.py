@@ -0,0 +1,44 @@
+import asyncio
+import logging
+import uuid
+
+from celery import shared_task
+from sqlalchemy.orm import selectinload
+
+from app.db.database import get_db_context
+from app.models.work_order import WorkOrder
+
+logger = logging.getLogger(__name__)
+
+@shared_task(name="app.background.tasks.notifications.notify_work_order_created")
+def notify_work_order_created(work_order_id):
+    """Send creation notifications for a work order from a worker
+
+    The API enqueues this after commit so the client/technician
+    lookups and provider calls stay off the request's critical path.
+    """
+    logger.info(f"Sending creation notifications for work order {work_order_id}")
+
+    try:
+        work_order_id = uuid.UUID(work_order_id) if isinstance(work_order_id, str) else work_order_id
+
+        with get_db_context() as db:
+            work_order = db.query(WorkOrder).options(
+                selectinload(WorkOrder.client),
+                selectinload(WorkOrder.technician)
+            ).filter(WorkOrder.id == work_order_id).first()
+
+            if not work_order:
+                logger.error(f"Work order {work_order_id} not found")
+                return f"Work order {work_order_id} not found"
+
+            # Import here to avoid circular imports
+            from app.services.work_order_service import WorkOrderService
+
+            asyncio.run(WorkOrderService._schedule_notifications(db, work_order))
+
+        return f"Sent creation notifications for work order {work_order_id}"
+
+    except Exception as e:
+        logger.error(f"Error sending work order notifications: {str(e)}")
+        raise
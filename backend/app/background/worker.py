@@ -31,7 +31,12 @@ celery_app.conf.update(
 
 # Auto-discover tasks in app/background/tasks
 celery_app.autodiscover_tasks(
-    ["app.background.tasks.invoices", "app.background.tasks.reminders", "app.background.tasks.reports"]
+    [
+        "app.background.tasks.invoices",
+        "app.background.tasks.notifications",
+        "app.background.tasks.reminders",
+        "app.background.tasks.reports",
+    ]
 )
 
 # Configure periodic tasks
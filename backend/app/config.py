@@ -21,9 +21,11 @@ class Settings(BaseSettings):
     # Database settings
     DATABASE_URL: str = os.getenv("DATABASE_URL", "postgresql://postgres:iutk604/@localhost/servicebusiness")
     DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
-    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    # Overflow sized so bursts queue on the database rather than on the
+    # pool; recycle hourly to stay ahead of idle-connection teardown
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "40"))
     DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
-    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "300"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "3600"))
     DB_ECHO_QUERIES: bool = os.getenv("DB_ECHO_QUERIES", "False").lower() == "true"
 
     # CORS settings
@@ -120,7 +122,7 @@ class Settings(BaseSettings):
             "max_overflow": self.DB_MAX_OVERFLOW,
             "pool_timeout": self.DB_POOL_TIMEOUT,
             "pool_pre_ping": True,
-            "pool_recycle": 300,  # Recycle connections every 5 minutes
+            "pool_recycle": self.DB_POOL_RECYCLE,
             "echo": self.DEBUG,
         }
 
@@ -1,6 +1,6 @@
 from fastapi import FastAPI, Depends, HTTPException, Security, Request, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import sqlalchemy
@@ -51,6 +51,7 @@ app = FastAPI(
     title=settings.APP_NAME,
     description="API for service business management",
     version=settings.API_VERSION,
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs" if settings.ENVIRONMENT != "production" else None,
     redoc_url="/api/redoc" if settings.ENVIRONMENT != "production" else None,
     openapi_tags=[
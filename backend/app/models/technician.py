@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, Boolean, DateTime, Text, Enum, Integer, Float
+from sqlalchemy import Column, String, ForeignKey, Boolean, DateTime, Text, Enum, Integer, SmallInteger, Float, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -9,6 +9,10 @@ from app.db.database import Base
 class Technician(Base):
     """Technician model for storing information about service technicians"""
     __tablename__ = "technicians"
+    __table_args__ = (
+        # Serves the @> containment filter on the skills array
+        Index("ix_technicians_skills", "skills", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, unique=True)
@@ -17,6 +21,8 @@ class Technician(Base):
     certifications = Column(JSONB, nullable=True)
     hourly_rate = Column(Float, nullable=True)
     availability = Column(JSONB, nullable=True, default=dict)  # Store weekly availability
+    workdays_mask = Column(SmallInteger, nullable=True)  # Bit per weekday, Monday = bit 0
+    hours_per_day = Column(Float, nullable=True)  # Parsed from availability workHours
     max_daily_jobs = Column(Integer, nullable=True, default=8)
     notes = Column(Text, nullable=True)
     status = Column(Enum("active", "inactive", "on_leave", name="technician_status_enum"), default="active")
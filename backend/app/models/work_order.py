@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, Boolean, DateTime, Text, Enum, Integer, Float
+from sqlalchemy import Column, String, ForeignKey, Boolean, DateTime, Text, Enum, Integer, Float, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -9,6 +9,27 @@ from app.db.database import Base
 class WorkOrder(Base):
     """Work order model for storing service job information"""
     __tablename__ = "work_orders"
+    __table_args__ = (
+        # Scheduling queries filter by technician + scheduled_start range
+        Index("ix_wo_tech_schedule", "assigned_technician_id", "scheduled_start", "scheduled_end"),
+        # Partial index covering calendar/conflict lookups on active orders
+        Index(
+            "ix_wo_active_schedule",
+            "scheduled_start",
+            postgresql_where=text("status IN ('pending', 'scheduled', 'in_progress')"),
+        ),
+        # List-endpoint filters ordered by created_at (scanned backwards
+        # for the DESC sort)
+        Index("ix_wo_status_created_at", "status", "created_at"),
+        Index("ix_wo_client_created_at", "client_id", "created_at"),
+        # Active-order guard checks per technician (e.g. delete path)
+        Index(
+            "ix_wo_tech_status",
+            "assigned_technician_id",
+            "status",
+            postgresql_where=text("status IN ('pending', 'scheduled', 'in_progress')"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     order_number = Column(String(50), unique=True, nullable=False, index=True)
@@ -36,10 +57,10 @@ class WorkOrder(Base):
     # Relationships
     client = relationship("Client", back_populates="work_orders")
     technician = relationship("Technician", foreign_keys=[assigned_technician_id], back_populates="work_orders")
-    services = relationship("WorkOrderService", back_populates="work_order", cascade="all, delete-orphan")
-    items = relationship("WorkOrderItem", back_populates="work_order", cascade="all, delete-orphan")
-    notes = relationship("WorkOrderNote", back_populates="work_order", cascade="all, delete-orphan")
-    status_history = relationship("WorkOrderStatusHistory", back_populates="work_order", cascade="all, delete-orphan")
+    services = relationship("WorkOrderService", back_populates="work_order", cascade="all, delete-orphan", passive_deletes=True)
+    items = relationship("WorkOrderItem", back_populates="work_order", cascade="all, delete-orphan", passive_deletes=True)
+    notes = relationship("WorkOrderNote", back_populates="work_order", cascade="all, delete-orphan", passive_deletes=True)
+    status_history = relationship("WorkOrderStatusHistory", back_populates="work_order", cascade="all, delete-orphan", passive_deletes=True)
     invoices = relationship("Invoice", back_populates="work_order")
     
     def __repr__(self):
@@ -70,7 +91,7 @@ class WorkOrderService(Base):
     __tablename__ = "work_order_services"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    work_order_id = Column(UUID(as_uuid=True), ForeignKey("work_orders.id"), nullable=False)
+    work_order_id = Column(UUID(as_uuid=True), ForeignKey("work_orders.id", ondelete="CASCADE"), nullable=False)
     service_id = Column(UUID(as_uuid=True), ForeignKey("services.id"), nullable=False)
     quantity = Column(Float, nullable=False, default=1.0)
     price = Column(Float, nullable=False)  # Price per unit
@@ -91,7 +112,7 @@ class WorkOrderItem(Base):
     __tablename__ = "work_order_items"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    work_order_id = Column(UUID(as_uuid=True), ForeignKey("work_orders.id"), nullable=False)
+    work_order_id = Column(UUID(as_uuid=True), ForeignKey("work_orders.id", ondelete="CASCADE"), nullable=False)
     #inventory_item_id = Column(UUID(as_uuid=True), ForeignKey("inventory_items.id"), nullable=False)
     quantity = Column(Float, nullable=False, default=1.0)
     price = Column(Float, nullable=False)  # Price per unit
@@ -112,7 +133,7 @@ class WorkOrderNote(Base):
     __tablename__ = "work_order_notes"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    work_order_id = Column(UUID(as_uuid=True), ForeignKey("work_orders.id"), nullable=False)
+    work_order_id = Column(UUID(as_uuid=True), ForeignKey("work_orders.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     note = Column(Text, nullable=False)
     is_private = Column(Boolean, default=False)  # If true, only visible to staff
@@ -131,7 +152,7 @@ class WorkOrderStatusHistory(Base):
     __tablename__ = "work_order_status_history"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    work_order_id = Column(UUID(as_uuid=True), ForeignKey("work_orders.id"), nullable=False)
+    work_order_id = Column(UUID(as_uuid=True), ForeignKey("work_orders.id", ondelete="CASCADE"), nullable=False)
     previous_status = Column(String(50), nullable=False)
     new_status = Column(String(50), nullable=False)
     changed_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
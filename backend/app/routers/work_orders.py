@@ -1,4 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Body, Path
+from fastapi.responses import StreamingResponse
+import orjson
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Optional
 import uuid
@@ -74,6 +76,35 @@ async def list_work_orders(
             detail="Error retrieving work orders"
         )
 
+@router.get("/work-orders/export")
+async def export_work_orders(
+    status: Optional[str] = Query(None, description="Filter by status"),
+    client_id: Optional[uuid.UUID] = Query(None, description="Filter by client ID"),
+    technician_id: Optional[uuid.UUID] = Query(None, description="Filter by technician ID"),
+    start_date: Optional[datetime] = Query(None, description="Filter by start date (ISO format)"),
+    end_date: Optional[datetime] = Query(None, description="Filter by end date (ISO format)"),
+    current_user: User = Depends(auth_handler.verify_manager_or_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    Export matching work orders as newline-delimited JSON.
+
+    Rows are streamed from a server-side cursor, so exports of any size
+    run in constant memory instead of loading the result set up front.
+    """
+    def generate_ndjson():
+        for row in WorkOrderService.stream_work_orders(
+            db=db,
+            status=status,
+            client_id=client_id,
+            technician_id=technician_id,
+            start_date=start_date,
+            end_date=end_date
+        ):
+            yield orjson.dumps(row) + b"\n"
+
+    return StreamingResponse(generate_ndjson(), media_type="application/x-ndjson")
+
 @router.post("/work-orders", response_model=WorkOrderResponse, status_code=status.HTTP_201_CREATED)
 async def create_work_order(
     work_order: WorkOrderCreate = Body(...),
@@ -110,7 +141,9 @@ async def get_work_order(
         )
     
     try:
-        return await WorkOrderService.get_work_order(db, work_order_id)
+        # Served from the Redis read-through cache when the payload is
+        # still fresh; mutations invalidate it after commit
+        return await WorkOrderService.get_work_order_cached(db, work_order_id)
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
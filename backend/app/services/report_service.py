@@ -1,5 +1,6 @@
 import logging
-from sqlalchemy.orm import Session
+import operator
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, and_, or_, desc, text
 from sqlalchemy.exc import SQLAlchemyError
 from typing import Optional, Dict, List, Any, Union
@@ -8,6 +9,7 @@ import uuid
 import csv
 import json
 import os
+import statistics
 from pathlib import Path
 from io import StringIO
 import tempfile
@@ -23,9 +25,29 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Ensure reports directory exists
 reports_dir = Path("storage/reports")
-reports_dir.mkdir(parents=True, exist_ok=True)
+_reports_dir_ready = False
+
+def _ensure_reports_dir() -> None:
+    """Create the reports directory on first use instead of at import time"""
+    global _reports_dir_ready
+    if not _reports_dir_ready:
+        reports_dir.mkdir(parents=True, exist_ok=True)
+        _reports_dir_ready = True
+
+# C-level multi-attribute fetchers for report row serialization
+_wo_fields = operator.attrgetter(
+    "id", "order_number", "title", "status", "created_at",
+    "scheduled_start", "scheduled_end", "actual_start", "actual_end"
+)
+_inv_fields = operator.attrgetter(
+    "id", "invoice_number", "status", "issue_date", "due_date",
+    "total", "amount_paid", "balance"
+)
+
+def _iso(value):
+    """Format a datetime/date as ISO-8601, passing through None"""
+    return value.isoformat() if value else None
 
 class ReportService:
     """Service for generating and retrieving reports"""
@@ -53,9 +75,14 @@ class ReportService:
                 and_(Payment.payment_date >= start_date, Payment.payment_date <= end_date)
             ).all()
             
-            # Calculate key metrics
-            total_invoiced = sum(inv.total for inv in invoices)
-            total_collected = sum(payment.amount for payment in payments if payment.status == "success")
+            # Calculate key metrics with DB-side aggregation to avoid Python-level summation
+            total_invoiced = float(db.query(func.sum(Invoice.total)).filter(
+                and_(Invoice.issue_date >= start_date.date(), Invoice.issue_date <= end_date.date())
+            ).scalar() or 0)
+            total_collected = float(db.query(func.sum(Payment.amount)).filter(
+                and_(Payment.payment_date >= start_date, Payment.payment_date <= end_date),
+                Payment.status == "success"
+            ).scalar() or 0)
             
             # Categorize invoices by status
             invoices_by_status = {}
@@ -67,7 +94,11 @@ class ReportService:
                     }
                 invoices_by_status[inv.status]["count"] += 1
                 invoices_by_status[inv.status]["total"] += inv.total
-            
+
+            # Round accumulated money fields once, after summation
+            for status_data in invoices_by_status.values():
+                status_data["total"] = round(status_data["total"], 2)
+
             # Payments by method
             payments_by_method = {}
             for payment in payments:
@@ -81,7 +112,10 @@ class ReportService:
                     }
                 payments_by_method[payment.payment_method]["count"] += 1
                 payments_by_method[payment.payment_method]["total"] += payment.amount
-            
+
+            for method_data in payments_by_method.values():
+                method_data["total"] = round(method_data["total"], 2)
+
             # Basic report data
             report_data = {
                 "period": {
@@ -89,8 +123,8 @@ class ReportService:
                     "end": end_date.isoformat()
                 },
                 "revenue": {
-                    "total_invoiced": total_invoiced,
-                    "total_collected": total_collected,
+                    "total_invoiced": round(total_invoiced, 2),
+                    "total_collected": round(total_collected, 2),
                     "collection_rate": (total_collected / total_invoiced * 100) if total_invoiced > 0 else 0
                 },
                 "invoices": {
@@ -162,6 +196,14 @@ class ReportService:
                     reverse=True
                 )[:10]  # Top 10
                 
+                # Round accumulated money fields once, after summation
+                for day_data in daily_revenue.values():
+                    day_data["invoiced"] = round(day_data["invoiced"], 2)
+                    day_data["collected"] = round(day_data["collected"], 2)
+
+                for client_data in top_clients:
+                    client_data["total"] = round(client_data["total"], 2)
+
                 # Add detailed data to report
                 report_data["daily_revenue"] = daily_revenue
                 report_data["top_clients"] = top_clients
@@ -304,7 +346,7 @@ class ReportService:
                         "average": sum(durations) / len(durations),
                         "min": min(durations),
                         "max": max(durations),
-                        "median": sorted(durations)[len(durations) // 2]
+                        "median": statistics.median(durations)
                     }
                 else:
                     report_data["job_duration"] = {
@@ -341,8 +383,10 @@ class ReportService:
             raise NotFoundException(f"Client with ID {client_id} not found")
         
         try:
-            # Get work orders for this client
-            work_orders = db.query(WorkOrder).filter(
+            # Get work orders for this client (technician eager-loaded for serialization)
+            work_orders = db.query(WorkOrder).options(
+                joinedload(WorkOrder.technician)
+            ).filter(
                 WorkOrder.client_id == client_id,
                 or_(
                     and_(WorkOrder.created_at >= start_date, WorkOrder.created_at <= end_date),
@@ -372,8 +416,18 @@ class ReportService:
             completed_orders = sum(1 for wo in work_orders if wo.status == "completed")
             completion_rate = (completed_orders / total_work_orders * 100) if total_work_orders > 0 else 0
             
-            total_invoiced = sum(inv.total for inv in invoices)
-            total_paid = sum(payment.amount for payment in payments if payment.status == "success")
+            # Money totals aggregated DB-side rather than summed in Python
+            total_invoiced = float(db.query(func.sum(Invoice.total)).filter(
+                Invoice.client_id == client_id,
+                and_(Invoice.issue_date >= start_date.date(), Invoice.issue_date <= end_date.date())
+            ).scalar() or 0)
+            total_paid = 0.0
+            if invoice_ids:
+                total_paid = float(db.query(func.sum(Payment.amount)).filter(
+                    Payment.invoice_id.in_(invoice_ids),
+                    and_(Payment.payment_date >= start_date, Payment.payment_date <= end_date),
+                    Payment.status == "success"
+                ).scalar() or 0)
             payment_rate = (total_paid / total_invoiced * 100) if total_invoiced > 0 else 0
             
             # Compile the report
@@ -394,35 +448,41 @@ class ReportService:
                     "work_orders_count": total_work_orders,
                     "completed_orders": completed_orders,
                     "completion_rate": completion_rate,
-                    "total_invoiced": total_invoiced,
-                    "total_paid": total_paid,
+                    "total_invoiced": round(total_invoiced, 2),
+                    "total_paid": round(total_paid, 2),
                     "payment_rate": payment_rate
                 },
                 "work_orders": [
                     {
-                        "id": str(wo.id),
-                        "order_number": wo.order_number,
-                        "title": wo.title,
-                        "status": wo.status,
-                        "created_at": wo.created_at.isoformat() if wo.created_at else None,
-                        "scheduled_start": wo.scheduled_start.isoformat() if wo.scheduled_start else None,
-                        "scheduled_end": wo.scheduled_end.isoformat() if wo.scheduled_end else None,
-                        "actual_start": wo.actual_start.isoformat() if wo.actual_start else None,
-                        "actual_end": wo.actual_end.isoformat() if wo.actual_end else None,
+                        "id": str(wo_id),
+                        "order_number": order_number,
+                        "title": title,
+                        "status": status,
+                        "created_at": _iso(created_at),
+                        "scheduled_start": _iso(scheduled_start),
+                        "scheduled_end": _iso(scheduled_end),
+                        "actual_start": _iso(actual_start),
+                        "actual_end": _iso(actual_end),
                         "technician": wo.technician.name if wo.technician else "Unassigned"
-                    } for wo in work_orders
+                    }
+                    for wo, (wo_id, order_number, title, status, created_at,
+                             scheduled_start, scheduled_end, actual_start, actual_end)
+                    in ((wo, _wo_fields(wo)) for wo in work_orders)
                 ],
                 "invoices": [
                     {
-                        "id": str(inv.id),
-                        "invoice_number": inv.invoice_number,
-                        "status": inv.status,
-                        "issue_date": inv.issue_date.isoformat() if inv.issue_date else None,
-                        "due_date": inv.due_date.isoformat() if inv.due_date else None,
-                        "total": inv.total,
-                        "amount_paid": inv.amount_paid,
-                        "balance": inv.balance
-                    } for inv in invoices
+                        "id": str(inv_id),
+                        "invoice_number": invoice_number,
+                        "status": status,
+                        "issue_date": _iso(issue_date),
+                        "due_date": _iso(due_date),
+                        "total": total,
+                        "amount_paid": amount_paid,
+                        "balance": balance
+                    }
+                    for inv_id, invoice_number, status, issue_date, due_date,
+                        total, amount_paid, balance
+                    in map(_inv_fields, invoices)
                 ]
             }
             
@@ -440,6 +500,7 @@ class ReportService:
     async def get_saved_reports(report_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get a list of saved reports"""
         try:
+            _ensure_reports_dir()
             reports = []
             
             # Define paths based on report type
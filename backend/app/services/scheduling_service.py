@@ -1,9 +1,13 @@
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased, joinedload, load_only
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import and_, or_, not_, func
-from typing import Optional, Dict, List, Any, Union
+from sqlalchemy import and_, or_, not_, case, func, text, update
+from typing import AsyncIterator, Optional, Dict, List, Any, Union
 from datetime import datetime, timedelta, time
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from time import monotonic
 import uuid
 
 from app.models.work_order import WorkOrder
@@ -11,10 +15,125 @@ from app.models.technician import Technician
 from app.models.client import Client
 from app.models.user import User
 from app.schemas.scheduling import ScheduleRequest, AppointmentSlot
+from app.services.cache_service import cache_service
+from app.services.technician_service import _availability_summary
+from app.services.work_order_service import _wo_cache_key
 from app.core.exceptions import NotFoundException, ConflictException, ValidationException
 
 logger = logging.getLogger(__name__)
 
+# Reference point for converting naive datetimes to integer epoch seconds
+_EPOCH = datetime(1970, 1, 1)
+
+# Hoisted unbound method: skips per-row attribute lookup in row formatting
+_iso = datetime.isoformat
+
+def _uuid_str(value) -> Optional[str]:
+    """Stringify a UUID column value, passing through None"""
+    return None if value is None else str(value)
+
+@lru_cache(maxsize=128)
+def _time(hour: int, minute: int) -> time:
+    """Memoized time-of-day constants for slot boundary computation"""
+    return time(hour, minute)
+
+# The active-technician set changes rarely but is re-fetched by every
+# schedule view; cache the shaped list per-process for a short window
+_ACTIVE_TECH_TTL = 30  # seconds
+_active_tech_cache: Dict[str, Any] = {"expires": 0.0, "items": None}
+
+def _active_technicians(db: Session) -> List[Dict[str, str]]:
+    """Get the active technician list, cached briefly to avoid repeated scans"""
+    now = monotonic()
+    if _active_tech_cache["items"] is not None and now < _active_tech_cache["expires"]:
+        return _active_tech_cache["items"]
+
+    rows = db.query(
+        Technician.id,
+        User.first_name,
+        User.last_name
+    ).join(
+        User, Technician.user_id == User.id
+    ).filter(Technician.status == "active").all()
+
+    items = [
+        {"id": str(row.id), "name": f"{row.first_name} {row.last_name}"}
+        for row in rows
+    ]
+    _active_tech_cache["items"] = items
+    _active_tech_cache["expires"] = now + _ACTIVE_TECH_TTL
+    return items
+
+def _invalidate_active_technicians() -> None:
+    """Drop the cached technician list after a status/availability write"""
+    _active_tech_cache["items"] = None
+    _active_tech_cache["expires"] = 0.0
+
+# Formatted slot lists are cached briefly in Redis; scheduling writes
+# invalidate the affected technician's entries
+_SLOT_CACHE_TTL = 60  # seconds
+
+async def _invalidate_slot_cache(technician_id: Optional[uuid.UUID] = None) -> None:
+    """Drop cached slot timelines after a scheduling write"""
+    if technician_id:
+        await cache_service.clear_pattern(f"slots:{technician_id}:*")
+    await cache_service.clear_pattern("slots:all:*")
+
+def _with_parsed_hours(hours: Dict[str, Any]) -> Dict[str, Any]:
+    """Return working hours with int fields added alongside the HH:MM strings
+
+    Parsing happens once at write time so readers can use the ints
+    directly instead of splitting the strings on every request.
+    """
+    parsed = dict(hours)
+    try:
+        parsed["start_h"], parsed["start_m"] = map(int, hours["start"].split(':'))
+        parsed["end_h"], parsed["end_m"] = map(int, hours["end"].split(':'))
+    except (AttributeError, KeyError, ValueError):
+        pass
+    return parsed
+
+@dataclass(slots=True)
+class TechAvailability:
+    """Availability settings parsed once per technician row"""
+    work_days: Optional[frozenset]
+    work_hours: Optional[Dict[str, str]]
+    exceptions_by_date: Dict[Any, Dict[str, Any]]
+
+# Parsed availability cached per technician, keyed by id + row version
+_avail_cache: Dict[Any, TechAvailability] = {}
+_AVAIL_CACHE_MAX = 256
+
+def _tech_availability(tech: Technician) -> TechAvailability:
+    """Get pre-parsed availability for a technician, cached until the row changes"""
+    key = (tech.id, tech.updated_at)
+    parsed = _avail_cache.get(key)
+    if parsed is not None:
+        return parsed
+
+    availability = tech.availability or {}
+    parsed = TechAvailability(
+        work_days=frozenset(availability["workDays"]) if "workDays" in availability else None,
+        work_hours=availability.get("workHours"),
+        exceptions_by_date=_exceptions_by_date(availability)
+    )
+
+    if len(_avail_cache) >= _AVAIL_CACHE_MAX:
+        _avail_cache.clear()
+    _avail_cache[key] = parsed
+    return parsed
+
+def _exceptions_by_date(availability: Dict[str, Any]) -> Dict[Any, Dict[str, Any]]:
+    """Index availability exceptions by parsed date for O(1) lookup"""
+    index = {}
+    for exception in availability.get("exceptions", []):
+        try:
+            index[datetime.fromisoformat(exception["date"]).date()] = exception
+        except (ValueError, KeyError, TypeError):
+            # Skip invalid exception format
+            continue
+    return index
+
 class SchedulingService:
     """Service for handling scheduling operations"""
     
@@ -28,61 +147,75 @@ class SchedulingService:
         view_type: str = "day"
     ) -> Dict[str, Any]:
         """Get schedule data for the given date range with filters"""
-        query = db.query(WorkOrder).filter(
-            (WorkOrder.scheduled_start >= start_date) & 
+        # Project only the columns serialized into the response: one SQL
+        # round-trip, no full ORM hydration for client/technician rows
+        tech_user = aliased(User)
+        query = db.query(
+            WorkOrder.id,
+            WorkOrder.title,
+            WorkOrder.scheduled_start,
+            WorkOrder.scheduled_end,
+            WorkOrder.status,
+            WorkOrder.client_id,
+            Client.company_name,
+            Client.first_name,
+            Client.last_name,
+            WorkOrder.assigned_technician_id,
+            tech_user.first_name.label("tech_first_name"),
+            tech_user.last_name.label("tech_last_name"),
+            WorkOrder.service_location,
+            WorkOrder.description,
+            WorkOrder.order_number,
+            WorkOrder.priority
+        ).outerjoin(
+            Client, WorkOrder.client_id == Client.id
+        ).outerjoin(
+            Technician, WorkOrder.assigned_technician_id == Technician.id
+        ).outerjoin(
+            tech_user, Technician.user_id == tech_user.id
+        ).filter(
+            (WorkOrder.scheduled_start >= start_date) &
             (WorkOrder.scheduled_start <= end_date) &
             (WorkOrder.status.in_(["pending", "scheduled", "in_progress"]))
         )
-        
+
         # Apply filters
         if technician_id:
             query = query.filter(WorkOrder.assigned_technician_id == technician_id)
-        
+
         if client_id:
             query = query.filter(WorkOrder.client_id == client_id)
-        
+
         # Get appointments
         appointments = query.all()
-        
-        # Format appointments for response
-        formatted_appointments = []
-        for appointment in appointments:
-            # Get client name
-            client_name = "Unknown"
-            if appointment.client:
-                client_name = appointment.client.company_name or f"{appointment.client.first_name} {appointment.client.last_name}"
-            
-            # Get technician name
-            technician_name = "Unassigned"
-            if appointment.technician:
-                technician_name = appointment.technician.name
-            
-            formatted_appointments.append({
-                "id": str(appointment.id),
+
+        # Format appointments for response in a single comprehension over
+        # the row tuples, names computed inline from the joined columns
+        formatted_appointments = [
+            {
+                "id": _uuid_str(appointment.id),
                 "title": appointment.title,
-                "start": appointment.scheduled_start.isoformat() if appointment.scheduled_start else None,
-                "end": appointment.scheduled_end.isoformat() if appointment.scheduled_end else None,
+                "start": _iso(appointment.scheduled_start) if appointment.scheduled_start else None,
+                "end": _iso(appointment.scheduled_end) if appointment.scheduled_end else None,
                 "status": appointment.status,
-                "client_id": str(appointment.client_id) if appointment.client_id else None,
-                "client_name": client_name,
-                "technician_id": str(appointment.assigned_technician_id) if appointment.assigned_technician_id else None,
-                "technician_name": technician_name,
+                "client_id": _uuid_str(appointment.client_id),
+                "client_name": (appointment.company_name or f"{appointment.first_name} {appointment.last_name}")
+                               if appointment.client_id else "Unknown",
+                "technician_id": _uuid_str(appointment.assigned_technician_id),
+                "technician_name": f"{appointment.tech_first_name} {appointment.tech_last_name}"
+                                   if appointment.assigned_technician_id and appointment.tech_first_name
+                                   else "Unassigned",
                 "location": appointment.service_location.get("address") if appointment.service_location else None,
                 "description": appointment.description,
                 "order_number": appointment.order_number,
                 "priority": appointment.priority
-            })
-        
-        # Get available technicians
-        available_technicians = []
-        technicians = db.query(Technician).filter(Technician.status == "active").all()
-        for tech in technicians:
-            if tech.user:
-                available_technicians.append({
-                    "id": str(tech.id),
-                    "name": f"{tech.user.first_name} {tech.user.last_name}",
-                })
+            }
+            for appointment in appointments
+        ]
         
+        # Get available technicians (cached with a short TTL)
+        available_technicians = _active_technicians(db)
+
         return {
             "appointments": formatted_appointments,
             "date_range": {
@@ -105,103 +238,141 @@ class SchedulingService:
         if not work_order:
             raise NotFoundException(f"Work order with ID {schedule_data.work_order_id} not found")
         
+        # Fast-path: most reschedules keep the same technician and
+        # window, so the validation/conflict round-trip is only needed
+        # when the assignment or the time window actually changes
+        same_assignment = (
+            schedule_data.technician_id is None
+            or schedule_data.technician_id == work_order.assigned_technician_id
+        )
+        unchanged_window = (
+            work_order.scheduled_start == schedule_data.start_time
+            and work_order.scheduled_end == schedule_data.end_time
+        )
+
+        # Check for scheduling conflicts if a technician is assigned
+        tech_row = None
+        if schedule_data.technician_id and not (same_assignment and unchanged_window):
+            # Fetch technician status/name and the conflict flag in a
+            # single round-trip. The EXISTS uses the canonical two-term
+            # interval-overlap predicate, which covers the
+            # starts-during/ends-during/contains cases in one check.
+            tech_row = db.execute(text("""
+                WITH tech AS (
+                    SELECT t.id, t.status, u.first_name, u.last_name
+                    FROM technicians t
+                    JOIN users u ON u.id = t.user_id
+                    WHERE t.id = :tid
+                )
+                SELECT tech.status,
+                       tech.first_name,
+                       tech.last_name,
+                       EXISTS(SELECT 1 FROM work_orders wo
+                              WHERE wo.assigned_technician_id = :tid
+                                AND wo.id <> :wid
+                                AND wo.status IN ('scheduled', 'in_progress')
+                                AND wo.scheduled_start < :end_t
+                                AND wo.scheduled_end > :start_t) AS has_conflict
+                FROM tech
+            """), {
+                "tid": str(schedule_data.technician_id),
+                "wid": str(work_order.id),
+                "start_t": schedule_data.start_time,
+                "end_t": schedule_data.end_time
+            }).first()
+
+            if not tech_row:
+                raise NotFoundException(f"Technician with ID {schedule_data.technician_id} not found")
+
+            # Check technician status
+            if tech_row.status != "active":
+                raise ValidationException(f"Technician is not active and cannot be scheduled")
+
+            if tech_row.has_conflict:
+                raise ConflictException("This scheduling would create a conflict with another appointment")
+
+        # Collect the new field values and apply them in one UPDATE
+        # statement rather than flushing per-attribute ORM mutations
+        values = {
+            "scheduled_start": schedule_data.start_time,
+            "scheduled_end": schedule_data.end_time,
+            "updated_by": user_id
+        }
+
+        previous_technician_id = work_order.assigned_technician_id
+        technician_id = previous_technician_id
+        if schedule_data.technician_id:
+            technician_id = schedule_data.technician_id
+            values["assigned_technician_id"] = technician_id
+
+        # Update status to scheduled if it's pending; the transition is
+        # evaluated server-side so a concurrent status change can't be
+        # clobbered with a stale value
+        values["status"] = case(
+            (WorkOrder.status == "pending", "scheduled"),
+            else_=WorkOrder.status
+        )
+        new_status = "scheduled" if work_order.status == "pending" else work_order.status
+
+        # Update notes if provided; append in SQL so the existing
+        # description text never has to round-trip through Python
+        if schedule_data.notes:
+            note_text = f"Scheduling Notes: {schedule_data.notes}"
+            values["description"] = case(
+                (WorkOrder.description.is_(None), note_text),
+                else_=WorkOrder.description + f"\n\n{note_text}"
+            )
+
+        # Format response from in-memory state before commit so the
+        # post-commit refresh SELECT isn't needed
+        client_name = "Unknown"
+        if work_order.client:
+            client_name = work_order.client.company_name or f"{work_order.client.first_name} {work_order.client.last_name}"
+
+        technician_name = "Unassigned"
+        if tech_row is not None:
+            technician_name = f"{tech_row.first_name} {tech_row.last_name}"
+        elif work_order.technician:
+            technician_name = work_order.technician.name
+
+        response = {
+            "id": str(work_order.id),
+            "work_order_id": str(work_order.id),
+            "order_number": work_order.order_number,
+            "title": work_order.title,
+            "start_time": schedule_data.start_time.isoformat() if schedule_data.start_time else None,
+            "end_time": schedule_data.end_time.isoformat() if schedule_data.end_time else None,
+            "client_id": str(work_order.client_id) if work_order.client_id else None,
+            "client_name": client_name,
+            "technician_id": str(technician_id) if technician_id else None,
+            "technician_name": technician_name,
+            "status": new_status,
+            "location": work_order.service_location.get("address") if work_order.service_location else None,
+            "notes": schedule_data.notes
+        }
+
         try:
-            # Check for scheduling conflicts if a technician is assigned
-            if schedule_data.technician_id:
-                # Check if the technician is available
-                technician = db.query(Technician).filter(Technician.id == schedule_data.technician_id).first()
-                if not technician:
-                    raise NotFoundException(f"Technician with ID {schedule_data.technician_id} not found")
-                
-                # Check technician status
-                if technician.status != "active":
-                    raise ValidationException(f"Technician is not active and cannot be scheduled")
-                
-                # Check for conflicts with existing appointments
-                conflicts = db.query(WorkOrder).filter(
-                    WorkOrder.assigned_technician_id == schedule_data.technician_id,
-                    WorkOrder.id != work_order.id,  # Exclude current work order
-                    WorkOrder.status.in_(["scheduled", "in_progress"]),
-                    (
-                        # New appointment starts during existing appointment
-                        (WorkOrder.scheduled_start <= schedule_data.start_time) & 
-                        (WorkOrder.scheduled_end > schedule_data.start_time)
-                    ) | (
-                        # New appointment ends during existing appointment
-                        (WorkOrder.scheduled_start < schedule_data.end_time) & 
-                        (WorkOrder.scheduled_end >= schedule_data.end_time)
-                    ) | (
-                        # New appointment completely contains existing appointment
-                        (WorkOrder.scheduled_start >= schedule_data.start_time) & 
-                        (WorkOrder.scheduled_end <= schedule_data.end_time)
-                    )
-                ).first()
-                
-                if conflicts:
-                    raise ConflictException("This scheduling would create a conflict with another appointment")
-                
-                # Update the work order with technician assignment
-                work_order.assigned_technician_id = schedule_data.technician_id
-            
-            # Update scheduling info
-            work_order.scheduled_start = schedule_data.start_time
-            work_order.scheduled_end = schedule_data.end_time
-            
-            # Update status to scheduled if it's pending
-            if work_order.status == "pending":
-                work_order.status = "scheduled"
-            
-            # Update notes if provided
-            if schedule_data.notes:
-                # Add to existing notes or create new
-                if work_order.description:
-                    work_order.description += f"\n\nScheduling Notes: {schedule_data.notes}"
-                else:
-                    work_order.description = f"Scheduling Notes: {schedule_data.notes}"
-            
-            # Update "updated_by" field
-            if hasattr(work_order, 'updated_by'):
-                work_order.updated_by = user_id
-            
-            # Save changes
+            db.execute(
+                update(WorkOrder)
+                .where(WorkOrder.id == work_order.id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
             db.commit()
-            db.refresh(work_order)
-            
-            # Format response
-            client_name = "Unknown"
-            if work_order.client:
-                client_name = work_order.client.company_name or f"{work_order.client.first_name} {work_order.client.last_name}"
-            
-            technician_name = "Unassigned"
-            if work_order.technician:
-                technician_name = work_order.technician.name
-            
-            return {
-                "id": str(work_order.id),
-                "work_order_id": str(work_order.id),
-                "order_number": work_order.order_number,
-                "title": work_order.title,
-                "start_time": work_order.scheduled_start.isoformat() if work_order.scheduled_start else None,
-                "end_time": work_order.scheduled_end.isoformat() if work_order.scheduled_end else None,
-                "client_id": str(work_order.client_id) if work_order.client_id else None,
-                "client_name": client_name,
-                "technician_id": str(work_order.assigned_technician_id) if work_order.assigned_technician_id else None,
-                "technician_name": technician_name,
-                "status": work_order.status,
-                "location": work_order.service_location.get("address") if work_order.service_location else None,
-                "notes": schedule_data.notes
-            }
-            
-        except (NotFoundException, ValidationException, ConflictException):
-            raise
         except SQLAlchemyError as e:
             db.rollback()
             logger.error(f"Database error scheduling appointment: {str(e)}")
             raise ConflictException(f"Failed to schedule appointment: {str(e)}")
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Error scheduling appointment: {str(e)}")
-            raise ValidationException(f"Failed to schedule appointment: {str(e)}")
+
+        # Booked time changed; drop cached slot timelines for the affected
+        # technician(s) and the cached single-read payload so
+        # GET /work-orders/{id} reflects the new assignment immediately
+        await cache_service.delete(_wo_cache_key(work_order.id))
+        await _invalidate_slot_cache(technician_id)
+        if previous_technician_id and previous_technician_id != technician_id:
+            await _invalidate_slot_cache(previous_technician_id)
+
+        return response
     
     @staticmethod
     async def get_available_slots(
@@ -210,7 +381,33 @@ class SchedulingService:
         technician_id: Optional[uuid.UUID] = None,
         duration_minutes: int = 60
     ) -> List[AppointmentSlot]:
-        """Get available appointment slots for the given date and technician"""
+        """Get available appointment slots as a list (see iter_available_slots)"""
+        cache_key = f"slots:{technician_id or 'all'}:{date_value.date().isoformat()}:{duration_minutes}"
+        cached = await cache_service.get(cache_key)
+        if cached is not None:
+            return cached
+
+        slots = [
+            slot async for slot in SchedulingService.iter_available_slots(
+                db, date_value, technician_id=technician_id, duration_minutes=duration_minutes
+            )
+        ]
+
+        await cache_service.set(cache_key, slots, ttl=_SLOT_CACHE_TTL)
+        return slots
+
+    @staticmethod
+    async def iter_available_slots(
+        db: Session,
+        date_value: datetime,
+        technician_id: Optional[uuid.UUID] = None,
+        duration_minutes: int = 60
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield available appointment slots for the given date and technician
+
+        Slots are produced incrementally so callers can stream them to the
+        client without materializing the whole day's list first.
+        """
         # Convert date to datetime objects for the full day
         start_datetime = datetime.combine(date_value.date(), time(0, 0))
         end_datetime = datetime.combine(date_value.date(), time(23, 59, 59))
@@ -222,124 +419,150 @@ class SchedulingService:
         # Slot interval in minutes (configurable)
         slot_interval = 30
         
-        # Query technicians
+        # Query technicians, loading only the columns the slot loop reads
+        tech_options = (
+            load_only(Technician.id, Technician.status, Technician.availability, Technician.updated_at),
+            joinedload(Technician.user).load_only(User.first_name, User.last_name)
+        )
         if technician_id:
-            technicians = [db.query(Technician).filter(
+            tech = db.query(Technician).options(*tech_options).filter(
                 Technician.id == technician_id,
                 Technician.status == "active"
-            ).first()]
-            
-            if not technicians[0]:
+            ).first()
+
+            if tech is None:
                 raise NotFoundException(f"Technician with ID {technician_id} not found or not active")
+
+            technicians = (tech,)
         else:
             # Get all active technicians
-            technicians = db.query(Technician).filter(Technician.status == "active").all()
-        
-        # Get all booked appointments for the date
-        booked_appointments = {}
-        for tech in technicians:
-            if tech:
-                tech_appointments = db.query(WorkOrder).filter(
-                    WorkOrder.assigned_technician_id == tech.id,
-                    WorkOrder.status.in_(["scheduled", "in_progress"]),
-                    WorkOrder.scheduled_start >= start_datetime,
-                    WorkOrder.scheduled_start <= end_datetime
-                ).all()
-                
-                booked_appointments[str(tech.id)] = tech_appointments
+            technicians = db.query(Technician).options(*tech_options).filter(
+                Technician.status == "active"
+            ).all()
+
+        # Get all booked appointments for the date in one query, grouped by technician
+        tech_ids = [tech.id for tech in technicians]
+        booked_appointments = defaultdict(list)
+        if tech_ids:
+            booked_rows = db.query(
+                WorkOrder.assigned_technician_id,
+                WorkOrder.scheduled_start,
+                WorkOrder.scheduled_end
+            ).filter(
+                WorkOrder.assigned_technician_id.in_(tech_ids),
+                WorkOrder.status.in_(["scheduled", "in_progress"]),
+                WorkOrder.scheduled_start >= start_datetime,
+                WorkOrder.scheduled_start <= end_datetime
+            ).all()
+
+            for row in booked_rows:
+                booked_appointments[str(row.assigned_technician_id)].append(
+                    (row.scheduled_start, row.scheduled_end)
+                )
         
+        # Hoist per-day constants out of the technician loop: neither the
+        # date nor the weekday string depends on the technician
+        slot_date = date_value.date()
+        day_of_week = date_value.strftime("%A").lower()
+
         # Generate available slots
-        available_slots = []
-        
         for tech in technicians:
-            if not tech:
-                continue
-                
             tech_booked = booked_appointments.get(str(tech.id), [])
             
-            # Check technician availability for this day
+            # Check technician availability for this day using the parsed,
+            # per-technician cached settings
+            avail = _tech_availability(tech)
             technician_available = True
             working_hours = {
                 "start": f"{business_start_hour:02d}:00",
                 "end": f"{business_end_hour:02d}:00"
             }
-            
-            if tech.availability:
-                # Get day of week
-                day_of_week = date_value.strftime("%A").lower()
-                
-                # Check if technician works this day
-                if "workDays" in tech.availability and day_of_week not in tech.availability["workDays"]:
-                    technician_available = False
-                
-                # Check for exceptions
-                if "exceptions" in tech.availability:
-                    for exception in tech.availability["exceptions"]:
-                        try:
-                            exception_date = datetime.fromisoformat(exception["date"]).date()
-                            if exception_date == date_value.date():
-                                # Check if technician is available on this exception date
-                                technician_available = exception.get("available", False)
-                                
-                                # If available with custom hours, use those
-                                if technician_available and "workingHours" in exception:
-                                    working_hours = exception["workingHours"]
-                                break
-                        except (ValueError, KeyError):
-                            # Skip invalid exception format
-                            continue
-                
-                # Use technician's working hours
-                if "workHours" in tech.availability and technician_available:
-                    working_hours = tech.availability["workHours"]
-            
+
+            # Check if technician works this day
+            if avail.work_days is not None and day_of_week not in avail.work_days:
+                technician_available = False
+
+            # Check for an exception on this date (indexed, not scanned)
+            exception = avail.exceptions_by_date.get(slot_date)
+            if exception is not None:
+                # Check if technician is available on this exception date
+                technician_available = exception.get("available", False)
+
+                # If available with custom hours, use those
+                if technician_available and "workingHours" in exception:
+                    working_hours = exception["workingHours"]
+
+            # Use technician's working hours
+            if avail.work_hours is not None and technician_available:
+                working_hours = avail.work_hours
+
             # Skip if technician is not available this day
             if not technician_available:
                 continue
             
-            # Parse working hours
+            # Parse working hours (pre-parsed int fields preferred; fall
+            # back to splitting the HH:MM strings for older rows)
             try:
-                start_hour, start_minute = map(int, working_hours["start"].split(':'))
-                end_hour, end_minute = map(int, working_hours["end"].split(':'))
-                
-                # Generate all possible slots during business hours
-                current_slot_start = datetime.combine(date_value.date(), time(start_hour, start_minute))
-                day_end = datetime.combine(date_value.date(), time(end_hour, end_minute))
-                
-                while current_slot_start + timedelta(minutes=duration_minutes) <= day_end:
-                    slot_end = current_slot_start + timedelta(minutes=duration_minutes)
-                    
-                    # Check if this slot conflicts with any booked appointments
-                    is_available = True
-                    for appointment in tech_booked:
-                        # Skip if appointment doesn't have scheduled times
-                        if not appointment.scheduled_start or not appointment.scheduled_end:
-                            continue
-                            
-                        # Check for conflict
-                        if (current_slot_start < appointment.scheduled_end and 
-                            slot_end > appointment.scheduled_start):
-                            is_available = False
-                            break
-                    
-                    if is_available:
-                        available_slots.append({
-                            "start_time": current_slot_start.isoformat(),
-                            "end_time": slot_end.isoformat(),
-                            "technician_id": str(tech.id),
-                            "technician_name": tech.name
-                        })
-                    
-                    # Move to next slot
-                    current_slot_start += timedelta(minutes=slot_interval)
-                    
+                if "start_h" in working_hours:
+                    start_hour, start_minute = working_hours["start_h"], working_hours["start_m"]
+                    end_hour, end_minute = working_hours["end_h"], working_hours["end_m"]
+                else:
+                    start_hour, start_minute = map(int, working_hours["start"].split(':'))
+                    end_hour, end_minute = map(int, working_hours["end"].split(':'))
+
+                # Work the slot timeline in integer epoch seconds: the hot
+                # loop compares ints instead of datetime objects, and
+                # datetimes are only materialized for slots that are free
+                day_start_s = int((
+                    datetime.combine(slot_date, _time(start_hour, start_minute)) - _EPOCH
+                ).total_seconds())
+                day_end_s = int((
+                    datetime.combine(slot_date, _time(end_hour, end_minute)) - _EPOCH
+                ).total_seconds())
+                duration_s = duration_minutes * 60
+                interval_s = slot_interval * 60
+
+                # Sort bookings once so slot checks become a forward sweep:
+                # slot starts only move forward, so expired intervals are
+                # skipped with a cursor instead of re-scanning every booking
+                intervals = sorted(
+                    (
+                        int((booked_start - _EPOCH).total_seconds()),
+                        int((booked_end - _EPOCH).total_seconds())
+                    )
+                    for booked_start, booked_end in tech_booked
+                    if booked_start and booked_end
+                )
+                interval_idx = 0
+                tech_id_str = str(tech.id)
+                tech_name = tech.name
+
+                for slot_start_s in range(day_start_s, day_end_s - duration_s + 1, interval_s):
+                    slot_end_s = slot_start_s + duration_s
+
+                    # Advance past bookings that ended before this slot
+                    while interval_idx < len(intervals) and intervals[interval_idx][1] <= slot_start_s:
+                        interval_idx += 1
+
+                    # With intervals sorted by start, only the first unexpired
+                    # booking can overlap: later ones start even later
+                    if (interval_idx < len(intervals)
+                            and intervals[interval_idx][0] < slot_end_s
+                            and intervals[interval_idx][1] > slot_start_s):
+                        continue
+
+                    yield {
+                        "start_time": (_EPOCH + timedelta(seconds=slot_start_s)).isoformat(),
+                        "end_time": (_EPOCH + timedelta(seconds=slot_end_s)).isoformat(),
+                        "technician_id": tech_id_str,
+                        "technician_name": tech_name
+                    }
+
             except (ValueError, KeyError):
                 # Skip if working hours format is invalid
                 logger.warning(f"Invalid working hours format for technician {tech.id}")
                 continue
-        
-        return available_slots
-    
+
     @staticmethod
     async def get_technician_availability(
         db: Session,
@@ -353,31 +576,41 @@ class SchedulingService:
         if not technician:
             raise NotFoundException(f"Technician with ID {technician_id} not found")
         
-        # Get scheduled appointments
-        appointments = db.query(WorkOrder).filter(
+        # Get scheduled appointments, projecting only the serialized columns
+        appointments = db.query(
+            WorkOrder.id,
+            WorkOrder.scheduled_start,
+            WorkOrder.scheduled_end,
+            WorkOrder.title,
+            WorkOrder.order_number,
+            WorkOrder.status,
+            WorkOrder.client_id,
+            Client.company_name,
+            Client.first_name,
+            Client.last_name
+        ).outerjoin(
+            Client, WorkOrder.client_id == Client.id
+        ).filter(
             WorkOrder.assigned_technician_id == technician_id,
             WorkOrder.status.in_(["scheduled", "in_progress"]),
             WorkOrder.scheduled_start >= start_date,
             WorkOrder.scheduled_start <= end_date
         ).all()
-        
+
         # Format appointments
-        formatted_appointments = []
-        for appointment in appointments:
-            # Get client name
-            client_name = "Unknown"
-            if appointment.client:
-                client_name = appointment.client.company_name or f"{appointment.client.first_name} {appointment.client.last_name}"
-                
-            formatted_appointments.append({
-                "id": str(appointment.id),
-                "start": appointment.scheduled_start.isoformat() if appointment.scheduled_start else None,
-                "end": appointment.scheduled_end.isoformat() if appointment.scheduled_end else None,
+        formatted_appointments = [
+            {
+                "id": _uuid_str(appointment.id),
+                "start": _iso(appointment.scheduled_start) if appointment.scheduled_start else None,
+                "end": _iso(appointment.scheduled_end) if appointment.scheduled_end else None,
                 "title": appointment.title,
                 "order_number": appointment.order_number,
-                "client_name": client_name,
+                "client_name": (appointment.company_name or f"{appointment.first_name} {appointment.last_name}")
+                               if appointment.client_id else "Unknown",
                 "status": appointment.status
-            })
+            }
+            for appointment in appointments
+        ]
         
         # Get availability settings
         availability = technician.availability or {
@@ -419,41 +652,57 @@ class SchedulingService:
         if not technician:
             raise NotFoundException(f"Technician with ID {technician_id} not found")
         
+        # Update availability settings, normalizing working hours to
+        # include pre-parsed int fields next to the HH:MM strings
+        exceptions = []
+        for exception in availability_data.get("exceptions", []):
+            exception = dict(exception)
+            for hours_key in ("workingHours", "working_hours"):
+                if exception.get(hours_key):
+                    exception[hours_key] = _with_parsed_hours(exception[hours_key])
+            exceptions.append(exception)
+
+        technician.availability = {
+            "workDays": availability_data["work_days"],
+            "workHours": _with_parsed_hours({
+                "start": availability_data["work_hours"]["start"],
+                "end": availability_data["work_hours"]["end"]
+            }),
+            "exceptions": exceptions
+        }
+
+        # Keep the denormalized summary columns in step with the JSON;
+        # workload utilization reads them in preference to re-parsing
+        technician.workdays_mask, technician.hours_per_day = _availability_summary(
+            technician.availability
+        )
+
+        # Update status if provided
+        if availability_data.get("status"):
+            technician.status = availability_data["status"]
+
+        # Update the "updated_by" field if it exists
+        if hasattr(technician, 'updated_by'):
+            technician.updated_by = user_id
+
         try:
-            # Update availability settings
-            technician.availability = {
-                "workDays": availability_data["work_days"],
-                "workHours": {
-                    "start": availability_data["work_hours"]["start"],
-                    "end": availability_data["work_hours"]["end"]
-                },
-                "exceptions": availability_data.get("exceptions", [])
-            }
-            
-            # Update status if provided
-            if availability_data.get("status"):
-                technician.status = availability_data["status"]
-            
-            # Update the "updated_by" field if it exists
-            if hasattr(technician, 'updated_by'):
-                technician.updated_by = user_id
-            
             db.commit()
-            db.refresh(technician)
-            
-            return {
-                "id": str(technician.id),
-                "name": technician.name,
-                "status": technician.status,
-                "availability": technician.availability,
-                "message": "Availability updated successfully"
-            }
-            
         except SQLAlchemyError as e:
             db.rollback()
             logger.error(f"Database error updating technician availability: {str(e)}")
             raise ConflictException(f"Failed to update technician availability: {str(e)}")
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Error updating technician availability: {str(e)}")
-            raise ValidationException(f"Failed to update technician availability: {str(e)}")
+
+        db.refresh(technician)
+
+        # Status/availability changed; drop the cached technician list and
+        # any cached slot timelines for this technician
+        _invalidate_active_technicians()
+        await _invalidate_slot_cache(technician_id)
+
+        return {
+            "id": str(technician.id),
+            "name": technician.name,
+            "status": technician.status,
+            "availability": technician.availability,
+            "message": "Availability updated successfully"
+        }
@@ -1,19 +1,144 @@
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import func, and_, or_, not_
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy import func, and_, or_, not_, case, cast, text, update, String
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import Optional, Dict, List, Any, Union
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
+from functools import lru_cache
+import asyncio
 import uuid
 import logging
 
 from app.models.technician import Technician
 from app.models.user import User
 from app.models.work_order import WorkOrder
+from app.models.client import Client
 from app.schemas.technician import TechnicianCreate, TechnicianUpdate
+from app.services.cache_service import cache_service
 from app.core.exceptions import NotFoundException, ConflictException, ValidationException
 
 logger = logging.getLogger(__name__)
 
+# The distinct skill list backs dropdowns on most list views but only
+# changes when a technician is written; cache it briefly in Redis
+_SKILLS_CACHE_KEY = "technician:skills"
+_SKILLS_CACHE_TTL = 60  # seconds
+
+# to_char pattern matching datetime.isoformat() for naive timestamps
+_ISO_TS = 'YYYY-MM-DD"T"HH24:MI:SS'
+
+# Weekday name -> date.weekday() index, for calendar math over ranges
+_DAY_INDEX = {
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+    "friday": 4, "saturday": 5, "sunday": 6
+}
+
+def _availability_summary(availability: Optional[Dict[str, Any]]):
+    """Derive (workdays_mask, hours_per_day) from an availability dict
+
+    The mask carries one bit per weekday (Monday = bit 0). Returns
+    (None, None) when the availability shape cannot be parsed, so
+    callers fall back to the default estimate.
+    """
+    if not availability or "workDays" not in availability or "workHours" not in availability:
+        return None, None
+
+    try:
+        mask = 0
+        for day in availability["workDays"]:
+            mask |= 1 << _DAY_INDEX[day]
+
+        work_hours = availability["workHours"]
+        start_hour, start_minute = map(int, work_hours["start"].split(':'))
+        end_hour, end_minute = map(int, work_hours["end"].split(':'))
+
+        hours = (end_hour + end_minute/60) - (start_hour + start_minute/60)
+        return mask, hours
+    except (KeyError, ValueError, TypeError):
+        return None, None
+
+@lru_cache(maxsize=16)
+def _period_ranges(period: str, today: date):
+    """Resolve a reporting period to (start, end, prev_start, prev_end, name)
+
+    Pure calendar arithmetic keyed on the period and the current day,
+    so repeated calls within the same day reuse the cached tuple.
+    """
+    now = datetime(today.year, today.month, today.day)
+    if period == "week":
+        start_date = now - timedelta(days=now.weekday(), weeks=1)  # Last week's Monday
+        end_date = start_date + timedelta(days=6)  # Last week's Sunday
+        prev_start = start_date - timedelta(weeks=1)
+        prev_end = end_date - timedelta(weeks=1)
+        period_name = "Last Week"
+    elif period == "month":
+        # Start of last month
+        if now.month == 1:
+            start_date = datetime(now.year - 1, 12, 1)
+        else:
+            start_date = datetime(now.year, now.month - 1, 1)
+            
+        # End of last month
+        if now.month == 1:
+            end_date = datetime(now.year, 1, 1) - timedelta(days=1)
+        else:
+            end_date = datetime(now.year, now.month, 1) - timedelta(days=1)
+            
+        # Previous month for comparison
+        if start_date.month == 1:
+            prev_start = datetime(start_date.year - 1, 12, 1)
+            prev_end = datetime(start_date.year, 1, 1) - timedelta(days=1)
+        else:
+            prev_start = datetime(start_date.year, start_date.month - 1, 1)
+            prev_end = start_date - timedelta(days=1)
+            
+        period_name = f"{start_date.strftime('%B %Y')}"
+    elif period == "quarter":
+        # Current quarter
+        current_quarter = (now.month - 1) // 3 + 1
+        if current_quarter == 1:
+            prev_quarter = 4
+            prev_year = now.year - 1
+        else:
+            prev_quarter = current_quarter - 1
+            prev_year = now.year
+            
+        # Last quarter start and end
+        start_month = (prev_quarter - 1) * 3 + 1
+        start_date = datetime(prev_year, start_month, 1)
+        if prev_quarter == 4:
+            end_date = datetime(prev_year + 1, 1, 1) - timedelta(days=1)
+        else:
+            end_date = datetime(prev_year, start_month + 3, 1) - timedelta(days=1)
+            
+        # Previous quarter for comparison
+        if prev_quarter == 1:
+            prev_prev_quarter = 4
+            prev_prev_year = prev_year - 1
+        else:
+            prev_prev_quarter = prev_quarter - 1
+            prev_prev_year = prev_year
+            
+        prev_start_month = (prev_prev_quarter - 1) * 3 + 1
+        prev_start = datetime(prev_prev_year, prev_start_month, 1)
+        if prev_prev_quarter == 4:
+            prev_end = datetime(prev_prev_year + 1, 1, 1) - timedelta(days=1)
+        else:
+            prev_end = datetime(prev_prev_year, prev_start_month + 3, 1) - timedelta(days=1)
+            
+        period_name = f"Q{prev_quarter} {prev_year}"
+    elif period == "year":
+        # Last year
+        start_date = datetime(now.year - 1, 1, 1)
+        end_date = datetime(now.year, 1, 1) - timedelta(days=1)
+        prev_start = datetime(now.year - 2, 1, 1)
+        prev_end = datetime(now.year - 1, 1, 1) - timedelta(days=1)
+        period_name = f"{start_date.year}"
+    else:
+        raise ValidationException(f"Invalid period: {period}")
+
+    return start_date, end_date, prev_start, prev_end, period_name
+
 class TechnicianService:
     """Service for handling technician operations"""
     
@@ -27,13 +152,16 @@ class TechnicianService:
         limit: int = 100
     ) -> Dict[str, Any]:
         """Get technicians with filtering and pagination"""
-        query = db.query(Technician)
-        
-        # Apply filters
+        # Build the filters once so the count and item queries share them
+        filters = []
+        needs_user_join = False
+
         if search:
             search_term = f"%{search}%"
-            # Join with users to search by name or email
-            query = query.join(User).filter(
+            # Join with users to search by name or email; the ILIKE
+            # predicates are served by pg_trgm GIN indexes on these columns
+            needs_user_join = True
+            filters.append(
                 or_(
                     User.first_name.ilike(search_term),
                     User.last_name.ilike(search_term),
@@ -41,19 +169,28 @@ class TechnicianService:
                     Technician.employee_id.ilike(search_term)
                 )
             )
-        
+
         if status:
-            query = query.filter(Technician.status == status)
-        
+            filters.append(Technician.status == status)
+
         if skill:
-            # Search for technicians who have the specified skill
-            query = query.filter(Technician.skills.any(skill))
-        
-        # Get total count for pagination
-        total = query.count()
-        
+            # Search for technicians who have the specified skill; the
+            # @> containment predicate is served by the GIN index on
+            # skills, unlike scalar = ANY(skills)
+            filters.append(Technician.skills.contains([skill]))
+
+        # Count with a plain COUNT(id) instead of query.count(), which
+        # wraps the joined select in a subquery; no ORDER BY on this path
+        count_query = db.query(func.count(Technician.id)).select_from(Technician)
+        if needs_user_join:
+            count_query = count_query.join(User)
+        total = count_query.filter(*filters).scalar()
+
         # Apply pagination
-        query = query.order_by(Technician.created_at.desc())
+        query = db.query(Technician)
+        if needs_user_join:
+            query = query.join(User)
+        query = query.filter(*filters).order_by(Technician.created_at.desc())
         technicians = query.offset(skip).limit(limit).all()
         
         return {
@@ -78,75 +215,74 @@ class TechnicianService:
         """Create a new technician"""
         # Check if a user account needs to be created or already exists
         user_id = technician_data.user_id
-        
-        if not user_id:
-            if not technician_data.user_email:
-                raise ValidationException("Either user_id or user_email must be provided")
-            
-            # Check if user already exists with provided email
-            existing_user = db.query(User).filter(User.email == technician_data.user_email).first()
-            
-            if existing_user:
-                # Check if this user is already a technician
-                existing_tech = db.query(Technician).filter(Technician.user_id == existing_user.id).first()
-                if existing_tech:
-                    raise ConflictException(f"User with email {technician_data.user_email} is already a technician")
-                
-                # Use existing user
-                user_id = existing_user.id
-                
-                # Update role if necessary
-                if existing_user.role != "technician":
-                    existing_user.role = "technician"
-            else:
-                # Create new user with technician role
-                new_user = User(
+
+        if not user_id and not technician_data.user_email:
+            raise ValidationException("Either user_id or user_email must be provided")
+
+        try:
+            if not user_id:
+                # Upsert the user account in one statement: creates it
+                # with the technician role, or promotes an existing row.
+                # No select-then-insert race under concurrent creates.
+                user_stmt = pg_insert(User).values(
                     email=technician_data.user_email,
                     first_name=technician_data.user_first_name or "",
                     last_name=technician_data.user_last_name or "",
                     role="technician",
                     is_active=True
-                )
-                
-                db.add(new_user)
-                db.flush()  # Get the ID
-                user_id = new_user.id
-        
-        try:
-            # Check if employee_id is unique if provided
-            if technician_data.employee_id:
-                existing = db.query(Technician).filter(Technician.employee_id == technician_data.employee_id).first()
-                if existing:
-                    raise ConflictException(f"Technician with employee ID {technician_data.employee_id} already exists")
-            
-            # Create new technician
-            new_technician = Technician(
+                ).on_conflict_do_update(
+                    index_elements=['email'],
+                    set_={'role': 'technician'}
+                ).returning(User.id)
+
+                user_id = db.execute(user_stmt).scalar_one()
+
+            availability = technician_data.availability or {
+                "workDays": ["monday", "tuesday", "wednesday", "thursday", "friday"],
+                "workHours": {
+                    "start": "08:00",
+                    "end": "17:00"
+                },
+                "exceptions": []
+            }
+            # Parse once at write time; read paths use the columns
+            workdays_mask, hours_per_day = _availability_summary(availability)
+
+            # Insert the technician atomically; a conflict on the unique
+            # user_id or employee_id returns no row instead of raising
+            tech_stmt = pg_insert(Technician).values(
                 user_id=user_id,
                 employee_id=technician_data.employee_id,
                 skills=technician_data.skills,
                 certifications=technician_data.certifications,
                 hourly_rate=technician_data.hourly_rate,
-                availability=technician_data.availability or {
-                    "workDays": ["monday", "tuesday", "wednesday", "thursday", "friday"],
-                    "workHours": {
-                        "start": "08:00",
-                        "end": "17:00"
-                    },
-                    "exceptions": []
-                },
+                availability=availability,
+                workdays_mask=workdays_mask,
+                hours_per_day=hours_per_day,
                 max_daily_jobs=technician_data.max_daily_jobs,
                 notes=technician_data.notes,
                 status=technician_data.status or "active",
                 service_radius=technician_data.service_radius,
                 location=technician_data.location
-            )
-            
-            db.add(new_technician)
+            ).on_conflict_do_nothing().returning(Technician)
+
+            # RETURNING hands back the full row, so no refresh SELECT
+            new_technician = db.execute(tech_stmt).scalar_one_or_none()
+
+            if new_technician is None:
+                db.rollback()
+                raise ConflictException(
+                    "A technician already exists for this user or employee ID"
+                )
+
             db.commit()
-            db.refresh(new_technician)
-            
+
+            await cache_service.delete(_SKILLS_CACHE_KEY)
+
             return new_technician
-            
+
+        except ConflictException:
+            raise
         except SQLAlchemyError as e:
             db.rollback()
             logger.error(f"Database error creating technician: {str(e)}")
@@ -159,30 +295,44 @@ class TechnicianService:
     @staticmethod
     async def update_technician(db: Session, technician_id: uuid.UUID, technician_data: TechnicianUpdate) -> Technician:
         """Update an existing technician"""
-        technician = await TechnicianService.get_technician(db, technician_id)
-        
+        update_data = technician_data.dict(exclude_unset=True)
+
+        if not update_data:
+            return await TechnicianService.get_technician(db, technician_id)
+
+        # Keep the pre-parsed availability columns in step with the JSON
+        if "availability" in update_data:
+            update_data["workdays_mask"], update_data["hours_per_day"] = \
+                _availability_summary(update_data["availability"])
+
         try:
-            # Validate employee_id uniqueness if being updated
-            if technician_data.employee_id and technician_data.employee_id != technician.employee_id:
-                existing = db.query(Technician).filter(
-                    Technician.employee_id == technician_data.employee_id,
-                    Technician.id != technician_id
-                ).first()
-                
-                if existing:
-                    raise ConflictException(f"Technician with employee ID {technician_data.employee_id} already exists")
-            
-            # Update technician with provided fields
-            update_data = technician_data.dict(exclude_unset=True)
-            
-            for key, value in update_data.items():
-                setattr(technician, key, value)
-            
+            # Write and read back in one atomic statement; the UPDATE
+            # takes the row lock itself and RETURNING hands back the new
+            # row, so neither the pre-SELECT nor the refresh is needed.
+            # employee_id uniqueness is enforced by the constraint, with
+            # IntegrityError mapped to a conflict.
+            stmt = update(Technician).where(
+                Technician.id == technician_id
+            ).values(**update_data).returning(Technician)
+
+            technician = db.execute(stmt).scalar_one_or_none()
+
+            if technician is None:
+                db.rollback()
+                raise NotFoundException(f"Technician with ID {technician_id} not found")
+
             db.commit()
-            db.refresh(technician)
-            
+
+            await cache_service.delete(_SKILLS_CACHE_KEY)
+
             return technician
-            
+
+        except NotFoundException:
+            raise
+        except IntegrityError as e:
+            db.rollback()
+            logger.error(f"Integrity error updating technician: {str(e)}")
+            raise ConflictException(f"Technician with employee ID {technician_data.employee_id} already exists")
         except SQLAlchemyError as e:
             db.rollback()
             logger.error(f"Database error updating technician: {str(e)}")
@@ -198,13 +348,16 @@ class TechnicianService:
         technician = await TechnicianService.get_technician(db, technician_id)
         
         try:
-            # Check for related records
-            work_orders = db.query(WorkOrder).filter(
+            # Check for related records with EXISTS so the scan stops at
+            # the first active work order instead of counting them all
+            active_query = db.query(WorkOrder).filter(
                 WorkOrder.assigned_technician_id == technician_id,
                 WorkOrder.status.in_(["pending", "scheduled", "in_progress"])
-            ).count()
-            
-            if work_orders > 0:
+            )
+
+            if db.query(active_query.exists()).scalar():
+                # Only pay for the exact count on the error path
+                work_orders = active_query.count()
                 raise ConflictException(f"Cannot delete technician with {work_orders} active work orders")
             
             # Optional: Update user role if this is the only technician record for the user
@@ -220,7 +373,9 @@ class TechnicianService:
             # Delete the technician
             db.delete(technician)
             db.commit()
-            
+
+            await cache_service.delete(_SKILLS_CACHE_KEY)
+
             return True
             
         except ConflictException:
@@ -244,115 +399,143 @@ class TechnicianService:
         """Get a technician's workload and scheduled jobs for a period"""
         technician = await TechnicianService.get_technician(db, technician_id)
         
-        # Get work orders assigned to this technician in the date range
-        work_orders = db.query(WorkOrder).filter(
-            WorkOrder.assigned_technician_id == technician_id,
-            WorkOrder.scheduled_start >= start_date,
-            WorkOrder.scheduled_start <= end_date
-        ).all()
-        
-        # Initialize workload data
-        workload = {
-            "technician_id": str(technician.id),
-            "technician_name": technician.name,
-            "date_range": {
-                "start": start_date.isoformat(),
-                "end": end_date.isoformat()
-            },
-            "total_jobs": len(work_orders),
-            "completed_jobs": 0,
-            "in_progress_jobs": 0,
-            "pending_jobs": 0,
-            "scheduled_jobs": 0,
-            "total_hours": 0,
-            "jobs_by_day": {},
-            "utilization_rate": 0,
-            "jobs": []
-        }
-        
-        # Calculate days in range
-        days_in_range = (end_date - start_date).days + 1
-        current_date = start_date.date()
-        
-        # Initialize jobs by day
-        for _ in range(days_in_range):
-            day_str = current_date.isoformat()
-            workload["jobs_by_day"][day_str] = 0
-            current_date += timedelta(days=1)
-        
-        # Process each work order
-        for wo in work_orders:
-            # Count by status
-            if wo.status == "completed":
-                workload["completed_jobs"] += 1
-            elif wo.status == "in_progress":
-                workload["in_progress_jobs"] += 1
-            elif wo.status == "pending":
-                workload["pending_jobs"] += 1
-            elif wo.status == "scheduled":
-                workload["scheduled_jobs"] += 1
-            
-            # Count jobs by day
-            wo_date = wo.scheduled_start.date().isoformat()
-            if wo_date in workload["jobs_by_day"]:
-                workload["jobs_by_day"][wo_date] += 1
-            
-            # Calculate hours if scheduled times exist
-            if wo.scheduled_start and wo.scheduled_end:
-                duration_hours = (wo.scheduled_end - wo.scheduled_start).total_seconds() / 3600
-                workload["total_hours"] += duration_hours
-            
-            # Format job for response
-            client_name = "Unknown"
-            if wo.client:
-                client_name = wo.client.company_name or f"{wo.client.first_name} {wo.client.last_name}"
-                
-            workload["jobs"].append({
-                "id": str(wo.id),
-                "order_number": wo.order_number,
-                "title": wo.title,
-                "status": wo.status,
-                "client_name": client_name,
-                "scheduled_start": wo.scheduled_start.isoformat() if wo.scheduled_start else None,
-                "scheduled_end": wo.scheduled_end.isoformat() if wo.scheduled_end else None,
-                "actual_start": wo.actual_start.isoformat() if wo.actual_start else None,
-                "actual_end": wo.actual_end.isoformat() if wo.actual_end else None,
-                "priority": wo.priority,
-                "location": wo.service_location.get("address") if wo.service_location else None
-            })
-        
-        # Calculate utilization rate based on technician availability
-        available_hours = 0
-        
-        # If technician has defined availability
-        if technician.availability and "workDays" in technician.availability and "workHours" in technician.availability:
-            work_days = technician.availability["workDays"]
-            work_hours = technician.availability["workHours"]
-            
-            # Extract work hours
-            try:
-                start_hour, start_minute = map(int, work_hours["start"].split(':'))
-                end_hour, end_minute = map(int, work_hours["end"].split(':'))
-                
-                hours_per_day = (end_hour + end_minute/60) - (start_hour + start_minute/60)
-                
-                # Count working days in the date range
-                current_date = start_date.date()
-                working_days = 0
-                
-                for _ in range(days_in_range):
-                    day_name = current_date.strftime("%A").lower()
-                    if day_name in work_days:
-                        working_days += 1
-                    current_date += timedelta(days=1)
-                
+        def _load() -> Dict[str, Any]:
+            """Blocking query work, run off the event loop"""
+            # Shared range predicate for the aggregate and detail queries
+            range_filter = (
+                WorkOrder.assigned_technician_id == technician_id,
+                WorkOrder.scheduled_start >= start_date,
+                WorkOrder.scheduled_start <= end_date
+            )
+
+            # Aggregate counts and hours in SQL instead of scanning rows in
+            # Python: one GROUP BY status, one GROUP BY day
+            status_counts = dict(
+                db.query(WorkOrder.status, func.count()).filter(
+                    *range_filter
+                ).group_by(WorkOrder.status).all()
+            )
+
+            daily_rows = db.query(
+                func.date(WorkOrder.scheduled_start),
+                func.count(),
+                func.sum(
+                    func.extract('epoch', WorkOrder.scheduled_end - WorkOrder.scheduled_start)
+                )
+            ).filter(*range_filter).group_by(
+                func.date(WorkOrder.scheduled_start)
+            ).all()
+
+            total_seconds = sum(row[2] or 0 for row in daily_rows)
+
+            # Initialize workload data
+            workload = {
+                "technician_id": str(technician.id),
+                "technician_name": technician.name,
+                "date_range": {
+                    "start": start_date.isoformat(),
+                    "end": end_date.isoformat()
+                },
+                "total_jobs": sum(status_counts.values()),
+                "completed_jobs": status_counts.get("completed", 0),
+                "in_progress_jobs": status_counts.get("in_progress", 0),
+                "pending_jobs": status_counts.get("pending", 0),
+                "scheduled_jobs": status_counts.get("scheduled", 0),
+                "total_hours": float(total_seconds) / 3600,
+                "jobs_by_day": {},
+                "utilization_rate": 0,
+                "jobs": []
+            }
+
+            # Calculate days in range
+            days_in_range = (end_date - start_date).days + 1
+            base_date = start_date.date()
+
+            # Initialize jobs by day
+            workload["jobs_by_day"] = {
+                (base_date + timedelta(days=offset)).isoformat(): 0
+                for offset in range(days_in_range)
+            }
+
+            for day, job_count, _ in daily_rows:
+                day_str = day.isoformat()
+                if day_str in workload["jobs_by_day"]:
+                    workload["jobs_by_day"][day_str] = job_count
+
+            # Fetch the job list as a column projection with the client name
+            # columns joined in, avoiding full ORM hydration and lazy loads.
+            # The id is cast to text and the timestamps rendered with
+            # to_char in the database, so the rows arrive JSON-ready.
+            # They stream through a server-side cursor in batches, keeping
+            # peak memory at the formatted dicts rather than rows plus dicts.
+            job_rows = db.query(
+                cast(WorkOrder.id, String).label("id"),
+                WorkOrder.order_number,
+                WorkOrder.title,
+                WorkOrder.status,
+                func.to_char(WorkOrder.scheduled_start, _ISO_TS).label("scheduled_start"),
+                func.to_char(WorkOrder.scheduled_end, _ISO_TS).label("scheduled_end"),
+                func.to_char(WorkOrder.actual_start, _ISO_TS).label("actual_start"),
+                func.to_char(WorkOrder.actual_end, _ISO_TS).label("actual_end"),
+                WorkOrder.priority,
+                WorkOrder.service_location,
+                Client.company_name,
+                Client.first_name,
+                Client.last_name
+            ).outerjoin(
+                Client, WorkOrder.client_id == Client.id
+            ).filter(*range_filter).execution_options(
+                stream_results=True
+            ).yield_per(200)
+
+            workload["jobs"] = [
+                {
+                    "id": row.id,
+                    "order_number": row.order_number,
+                    "title": row.title,
+                    "status": row.status,
+                    "client_name": (
+                        row.company_name or f"{row.first_name} {row.last_name}"
+                    ) if (row.company_name or row.first_name) else "Unknown",
+                    "scheduled_start": row.scheduled_start,
+                    "scheduled_end": row.scheduled_end,
+                    "actual_start": row.actual_start,
+                    "actual_end": row.actual_end,
+                    "priority": row.priority,
+                    "location": row.service_location.get("address") if row.service_location else None
+                }
+                for row in job_rows
+            ]
+
+            # Calculate utilization rate based on technician availability,
+            # preferring the pre-parsed columns over re-parsing the JSON
+            workdays_mask = technician.workdays_mask
+            hours_per_day = technician.hours_per_day
+            if workdays_mask is None or hours_per_day is None:
+                workdays_mask, hours_per_day = _availability_summary(technician.availability)
+
+            if workdays_mask is not None and hours_per_day is not None:
+                # Count working days in the date range with calendar math
+                # instead of walking every day: each weekday occurs once
+                # per full week, plus once more if it falls in the remainder
+                full_weeks, remainder = divmod(days_in_range, 7)
+                start_weekday = base_date.weekday()
+                working_days = sum(
+                    full_weeks + (1 if (weekday - start_weekday) % 7 < remainder else 0)
+                    for weekday in range(7) if workdays_mask & (1 << weekday)
+                )
+
                 available_hours = working_days * hours_per_day
-                
-                # Consider exceptions if they exist
-                if "exceptions" in technician.availability:
-                    for exception in technician.availability["exceptions"]:
-                        exception_date = datetime.fromisoformat(exception["date"]).date()
-                        if start_date.date() <= exception_date <= end_date.date():
+
+                # Consider exceptions if they exist. ISO date strings
+                # order lexicographically, so the range check runs on the
+                # raw strings and out-of-window entries are never parsed.
+                range_lo = start_date.date().isoformat()
+                range_hi = end_date.date().isoformat()
+                try:
+                    for exception in (technician.availability or {}).get("exceptions", []):
+                        exception_date = exception["date"][:10]
+                        if range_lo <= exception_date <= range_hi:
                             if not exception.get("available", False):
                                 # Subtract a full day
                                 available_hours -= hours_per_day
@@ -362,154 +545,96 @@ class TechnicianService:
                                 ex_end = exception["working_hours"]["end"].split(':')
                                 ex_hours = (int(ex_end[0]) + int(ex_end[1])/60) - (int(ex_start[0]) + int(ex_start[1])/60)
                                 available_hours = available_hours - hours_per_day + ex_hours
-            
-            except (KeyError, ValueError):
-                # Default to 8 hours per working day if format is incorrect
+                except (KeyError, ValueError):
+                    # Malformed exception entries: keep the base estimate
+                    pass
+            else:
+                # Default calculation if no availability defined
                 working_days = days_in_range * (5/7)  # Estimate based on 5-day workweek
                 available_hours = working_days * 8
-        else:
-            # Default calculation if no availability defined
-            working_days = days_in_range * (5/7)  # Estimate based on 5-day workweek
-            available_hours = working_days * 8
         
-        # Calculate utilization rate
-        if available_hours > 0:
-            workload["utilization_rate"] = min(100, (workload["total_hours"] / available_hours) * 100)
+            # Calculate utilization rate
+            if available_hours > 0:
+                workload["utilization_rate"] = min(100, (workload["total_hours"] / available_hours) * 100)
         
-        return workload
+            return workload
+
+        # The handful of queries here would otherwise block the ASGI
+        # event loop for the whole endpoint; run them in a worker thread
+        return await asyncio.to_thread(_load)
     
     @staticmethod
     async def get_technician_performance(db: Session, technician_id: uuid.UUID, period: str = "month") -> Dict[str, Any]:
         """Get performance metrics for a technician"""
         technician = await TechnicianService.get_technician(db, technician_id)
         
-        # Set date range based on period
-        now = datetime.utcnow()
-        if period == "week":
-            start_date = now - timedelta(days=now.weekday(), weeks=1)  # Last week's Monday
-            end_date = start_date + timedelta(days=6)  # Last week's Sunday
-            prev_start = start_date - timedelta(weeks=1)
-            prev_end = end_date - timedelta(weeks=1)
-            period_name = "Last Week"
-        elif period == "month":
-            # Start of last month
-            if now.month == 1:
-                start_date = datetime(now.year - 1, 12, 1)
-            else:
-                start_date = datetime(now.year, now.month - 1, 1)
-            
-            # End of last month
-            if now.month == 1:
-                end_date = datetime(now.year, 1, 1) - timedelta(days=1)
-            else:
-                end_date = datetime(now.year, now.month, 1) - timedelta(days=1)
-            
-            # Previous month for comparison
-            if start_date.month == 1:
-                prev_start = datetime(start_date.year - 1, 12, 1)
-                prev_end = datetime(start_date.year, 1, 1) - timedelta(days=1)
-            else:
-                prev_start = datetime(start_date.year, start_date.month - 1, 1)
-                prev_end = start_date - timedelta(days=1)
-            
-            period_name = f"{start_date.strftime('%B %Y')}"
-        elif period == "quarter":
-            # Current quarter
-            current_quarter = (now.month - 1) // 3 + 1
-            if current_quarter == 1:
-                prev_quarter = 4
-                prev_year = now.year - 1
-            else:
-                prev_quarter = current_quarter - 1
-                prev_year = now.year
-            
-            # Last quarter start and end
-            start_month = (prev_quarter - 1) * 3 + 1
-            start_date = datetime(prev_year, start_month, 1)
-            if prev_quarter == 4:
-                end_date = datetime(prev_year + 1, 1, 1) - timedelta(days=1)
-            else:
-                end_date = datetime(prev_year, start_month + 3, 1) - timedelta(days=1)
-            
-            # Previous quarter for comparison
-            if prev_quarter == 1:
-                prev_prev_quarter = 4
-                prev_prev_year = prev_year - 1
-            else:
-                prev_prev_quarter = prev_quarter - 1
-                prev_prev_year = prev_year
-            
-            prev_start_month = (prev_prev_quarter - 1) * 3 + 1
-            prev_start = datetime(prev_prev_year, prev_start_month, 1)
-            if prev_prev_quarter == 4:
-                prev_end = datetime(prev_prev_year + 1, 1, 1) - timedelta(days=1)
-            else:
-                prev_end = datetime(prev_prev_year, prev_start_month + 3, 1) - timedelta(days=1)
-            
-            period_name = f"Q{prev_quarter} {prev_year}"
-        elif period == "year":
-            # Last year
-            start_date = datetime(now.year - 1, 1, 1)
-            end_date = datetime(now.year, 1, 1) - timedelta(days=1)
-            prev_start = datetime(now.year - 2, 1, 1)
-            prev_end = datetime(now.year - 1, 1, 1) - timedelta(days=1)
-            period_name = f"{start_date.year}"
-        else:
-            raise ValidationException(f"Invalid period: {period}")
-        
-        # Current period jobs
-        work_orders = db.query(WorkOrder).filter(
-            WorkOrder.assigned_technician_id == technician_id,
-            or_(
-                and_(WorkOrder.created_at >= start_date, WorkOrder.created_at <= end_date),
-                and_(WorkOrder.scheduled_start >= start_date, WorkOrder.scheduled_start <= end_date),
-                and_(WorkOrder.actual_start >= start_date, WorkOrder.actual_start <= end_date),
-                and_(WorkOrder.actual_end >= start_date, WorkOrder.actual_end <= end_date)
+        # Resolve the period to its date ranges (memoized per day)
+        start_date, end_date, prev_start, prev_end, period_name = _period_ranges(
+            period, datetime.utcnow().date()
+        )
+        
+        # All metrics are simple aggregates; compute them in SQL instead
+        # of materializing every work order row and looping in Python
+        has_duration = and_(
+            WorkOrder.actual_start.isnot(None),
+            WorkOrder.actual_end.isnot(None)
+        )
+        duration_minutes = func.extract(
+            'epoch', WorkOrder.actual_end - WorkOrder.actual_start
+        ) / 60
+
+        def period_clause(range_start: datetime, range_end: datetime):
+            """Predicate for a work order touching one reporting period"""
+            return or_(
+                and_(WorkOrder.created_at >= range_start, WorkOrder.created_at <= range_end),
+                and_(WorkOrder.scheduled_start >= range_start, WorkOrder.scheduled_start <= range_end),
+                and_(WorkOrder.actual_start >= range_start, WorkOrder.actual_start <= range_end),
+                and_(WorkOrder.actual_end >= range_start, WorkOrder.actual_end <= range_end)
             )
-        ).all()
-        
-        # Previous period jobs for comparison
-        prev_work_orders = db.query(WorkOrder).filter(
-            WorkOrder.assigned_technician_id == technician_id,
-            or_(
-                and_(WorkOrder.created_at >= prev_start, WorkOrder.created_at <= prev_end),
-                and_(WorkOrder.scheduled_start >= prev_start, WorkOrder.scheduled_start <= prev_end),
-                and_(WorkOrder.actual_start >= prev_start, WorkOrder.actual_start <= prev_end),
-                and_(WorkOrder.actual_end >= prev_start, WorkOrder.actual_end <= prev_end)
+
+        in_current = period_clause(start_date, end_date)
+        in_previous = period_clause(prev_start, prev_end)
+
+        def period_columns(in_period):
+            """Conditional aggregates restricted to one period's rows"""
+            return (
+                func.sum(case((in_period, 1), else_=0)),
+                func.sum(case((and_(in_period, WorkOrder.status == "completed"), 1), else_=0)),
+                func.sum(case((and_(in_period, has_duration), duration_minutes), else_=0)),
+                func.sum(case((and_(in_period, has_duration), 1), else_=0))
             )
-        ).all()
-        
+
+        # One round-trip for both windows: each aggregate is gated on its
+        # period predicate, scanning the union of the two ranges once.
+        # Execution happens in a worker thread to keep the loop free.
+        combined_query = db.query(
+            *period_columns(in_current),
+            *period_columns(in_previous)
+        ).filter(
+            WorkOrder.assigned_technician_id == technician_id,
+            or_(in_current, in_previous)
+        )
+        combined = await asyncio.to_thread(combined_query.one)
+
+        row, prev_row = combined[:4], combined[4:]
+
         # Calculate metrics
-        total_jobs = len(work_orders)
-        completed_jobs = sum(1 for wo in work_orders if wo.status == "completed")
+        total_jobs = int(row[0] or 0)
+        completed_jobs = int(row[1] or 0)
         completion_rate = (completed_jobs / total_jobs * 100) if total_jobs > 0 else 0
-        
-        prev_total_jobs = len(prev_work_orders)
-        prev_completed_jobs = sum(1 for wo in prev_work_orders if wo.status == "completed")
+
+        prev_total_jobs = int(prev_row[0] or 0)
+        prev_completed_jobs = int(prev_row[1] or 0)
         prev_completion_rate = (prev_completed_jobs / prev_total_jobs * 100) if prev_total_jobs > 0 else 0
-        
-        # Calculate average job duration
-        total_duration = 0
-        job_count_with_duration = 0
-        for wo in work_orders:
-            if wo.actual_start and wo.actual_end:
-                duration = (wo.actual_end - wo.actual_start).total_seconds() / 60  # minutes
-                total_duration += duration
-                job_count_with_duration += 1
-        
+
+        total_duration = float(row[2] or 0)
+        job_count_with_duration = int(row[3] or 0)
         avg_duration = total_duration / job_count_with_duration if job_count_with_duration > 0 else 0
-        
-        # Similar calculation for previous period
-        prev_total_duration = 0
-        prev_job_count_with_duration = 0
-        for wo in prev_work_orders:
-            if wo.actual_start and wo.actual_end:
-                duration = (wo.actual_end - wo.actual_start).total_seconds() / 60
-                prev_total_duration += duration
-                prev_job_count_with_duration += 1
-        
+
+        prev_total_duration = float(prev_row[2] or 0)
+        prev_job_count_with_duration = int(prev_row[3] or 0)
         prev_avg_duration = prev_total_duration / prev_job_count_with_duration if prev_job_count_with_duration > 0 else 0
-        
+
         # Calculate metrics changes
         jobs_change = ((total_jobs - prev_total_jobs) / prev_total_jobs * 100) if prev_total_jobs > 0 else 0
         completion_rate_change = completion_rate - prev_completion_rate
@@ -557,12 +682,20 @@ class TechnicianService:
     @staticmethod
     async def get_all_skills(db: Session) -> List[str]:
         """Get a unique list of all skills across all technicians"""
-        technicians = db.query(Technician).all()
-        
-        # Collect all skills from all technicians
-        all_skills = set()
-        for tech in technicians:
-            if tech.skills:
-                all_skills.update(tech.skills)
-        
-        return sorted(list(all_skills))
\ No newline at end of file
+        cached = await cache_service.get(_SKILLS_CACHE_KEY)
+        if cached is not None:
+            return cached
+
+        # Deduplicate in SQL so only the distinct skill strings cross the
+        # wire instead of every technician row
+        rows = db.execute(
+            text(
+                "SELECT DISTINCT unnest(skills) AS skill "
+                "FROM technicians WHERE skills IS NOT NULL "
+                "ORDER BY skill"
+            )
+        ).all()
+
+        skills = [row.skill for row in rows]
+        await cache_service.set(_SKILLS_CACHE_KEY, skills, ttl=_SKILLS_CACHE_TTL)
+        return skills
\ No newline at end of file
@@ -1,16 +1,92 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import bindparam, cast, func, select, text, String
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, Union
+import asyncio
 import uuid
 from datetime import datetime
+from time import monotonic
+import json
 import logging
 
 from app.models.work_order import WorkOrder, WorkOrderStatusHistory, WorkOrderService as WorkOrderServiceModel, WorkOrderItem, WorkOrderNote
+from app.models.client import Client
+from app.models.technician import Technician
+from app.models.service import Service
+from app.models.inventory import InventoryItem
+from app.models.invoice import Invoice
+from app.models.settings import Settings
 from app.schemas.work_order import WorkOrderCreate, WorkOrderUpdate, WorkOrderResponse
+from app.schemas.notification import NotificationCreate
 from app.core.exceptions import NotFoundException, ConflictException, ValidationException, BadRequestException
+from app.services.cache_service import cache_service
 
 logger = logging.getLogger(__name__)
 
+# to_char pattern producing isoformat()-compatible timestamps DB-side
+_ISO_TS = 'YYYY-MM-DD"T"HH24:MI:SS'
+
+# Serialized single work orders are cached briefly for the read path;
+# update/delete invalidate after commit
+_WO_CACHE_TTL = 30  # seconds
+
+def _wo_cache_key(work_order_id: uuid.UUID) -> str:
+    return f"work_order:{work_order_id}"
+
+# The order-number prefix only changes via admin settings edits; cache
+# it per-process for a short window so creates skip the settings query
+_PREFIX_TTL = 60  # seconds
+_prefix_cache: Dict[str, Any] = {"expires": 0.0, "value": None}
+
+def _order_number_prefix(db: Session) -> str:
+    """Get the configured order-number prefix, cached briefly"""
+    now = monotonic()
+    if _prefix_cache["value"] is not None and now < _prefix_cache["expires"]:
+        return _prefix_cache["value"]
+
+    settings = db.query(Settings).filter(Settings.key == "work_order_settings").first()
+    prefix = settings.value.get("auto_number_prefix", "WO-") if settings else "WO-"
+
+    _prefix_cache["value"] = prefix
+    _prefix_cache["expires"] = now + _PREFIX_TTL
+    return prefix
+
+@lru_cache(maxsize=32)
+def _list_stmt(has_status: bool, has_client: bool, has_tech: bool,
+               has_start: bool, has_end: bool):
+    """Build the list statement for one combination of active filters
+
+    The statement is constructed once per combination (32 at most) and
+    parameterized with bindparams, so repeated list calls reuse both
+    the select() object and SQLAlchemy's compiled-SQL cache entry.
+    COUNT(*) OVER () sees the filtered set before LIMIT applies, so one
+    statement serves both the page and the total.
+    """
+    filters = []
+    if has_status:
+        filters.append(WorkOrder.status == bindparam("status"))
+    if has_client:
+        filters.append(WorkOrder.client_id == bindparam("client_id"))
+    if has_tech:
+        filters.append(WorkOrder.assigned_technician_id == bindparam("technician_id"))
+    if has_start:
+        filters.append(WorkOrder.scheduled_start >= bindparam("start_date"))
+    if has_end:
+        filters.append(WorkOrder.scheduled_start <= bindparam("end_date"))
+
+    return select(
+        WorkOrder,
+        func.count().over().label("total")
+    ).options(
+        selectinload(WorkOrder.client),
+        selectinload(WorkOrder.technician),
+        selectinload(WorkOrder.services),
+        selectinload(WorkOrder.items)
+    ).where(*filters).order_by(
+        WorkOrder.created_at.desc()
+    ).limit(bindparam("page_limit")).offset(bindparam("page_skip"))
+
 class WorkOrderService:
     """Enhanced service for handling work order operations"""
     
@@ -26,27 +102,51 @@ class WorkOrderService:
         end_date: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Get work orders with filtering options"""
-        query = db.query(WorkOrder)
-        
-        # Apply filters
+        # Bind the active filter values; the statement itself is memoized
+        # per filter combination in _list_stmt
+        params: Dict[str, Any] = {"page_limit": limit, "page_skip": skip}
         if status:
-            query = query.filter(WorkOrder.status == status)
+            params["status"] = status
         if client_id:
-            query = query.filter(WorkOrder.client_id == client_id)
+            params["client_id"] = client_id
         if technician_id:
-            query = query.filter(WorkOrder.assigned_technician_id == technician_id)
+            params["technician_id"] = technician_id
         if start_date:
-            query = query.filter(WorkOrder.scheduled_start >= start_date)
+            params["start_date"] = start_date
         if end_date:
-            query = query.filter(WorkOrder.scheduled_start <= end_date)
-        
-        # Get total count for pagination
-        total = query.count()
-        
-        # Apply pagination
-        query = query.order_by(WorkOrder.created_at.desc())
-        work_orders = query.offset(skip).limit(limit).all()
-        
+            params["end_date"] = end_date
+
+        stmt = _list_stmt(
+            bool(status), bool(client_id), bool(technician_id),
+            bool(start_date), bool(end_date)
+        )
+
+        # Run the blocking Session work on a worker thread so the
+        # event loop keeps serving other requests while the page and
+        # its eager loads come back
+        def _load():
+            rows = db.execute(stmt, params).all()
+            total = rows[0].total if rows else 0
+            # A page past the end returns no rows; fall back to a count
+            # so the pagination metadata stays correct
+            if not rows and skip:
+                filters = []
+                if status:
+                    filters.append(WorkOrder.status == status)
+                if client_id:
+                    filters.append(WorkOrder.client_id == client_id)
+                if technician_id:
+                    filters.append(WorkOrder.assigned_technician_id == technician_id)
+                if start_date:
+                    filters.append(WorkOrder.scheduled_start >= start_date)
+                if end_date:
+                    filters.append(WorkOrder.scheduled_start <= end_date)
+                total = db.query(func.count(WorkOrder.id)).filter(*filters).scalar()
+            return rows, total
+
+        rows, total = await asyncio.to_thread(_load)
+        work_orders = [row[0] for row in rows]
+
         return {
             "total": total,
             "items": work_orders,
@@ -54,63 +154,109 @@ class WorkOrderService:
             "pages": (total + limit - 1) // limit
         }
     
+    @staticmethod
+    def stream_work_orders(
+        db: Session,
+        status: Optional[str] = None,
+        client_id: Optional[uuid.UUID] = None,
+        technician_id: Optional[uuid.UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        batch_size: int = 200
+    ):
+        """Stream matching work orders as plain dicts for exports
+
+        A server-side cursor (stream_results + yield_per) keeps peak
+        memory at O(batch_size) regardless of how many rows match, so
+        full exports do not go through the paginated list path. Rows
+        are a column projection with timestamps formatted in the
+        database, ready to serialize as-is.
+        """
+        filters = []
+        if status:
+            filters.append(WorkOrder.status == status)
+        if client_id:
+            filters.append(WorkOrder.client_id == client_id)
+        if technician_id:
+            filters.append(WorkOrder.assigned_technician_id == technician_id)
+        if start_date:
+            filters.append(WorkOrder.scheduled_start >= start_date)
+        if end_date:
+            filters.append(WorkOrder.scheduled_start <= end_date)
+
+        rows = db.query(
+            cast(WorkOrder.id, String).label("id"),
+            WorkOrder.order_number,
+            WorkOrder.title,
+            WorkOrder.status,
+            WorkOrder.priority,
+            func.to_char(WorkOrder.scheduled_start, _ISO_TS).label("scheduled_start"),
+            func.to_char(WorkOrder.scheduled_end, _ISO_TS).label("scheduled_end"),
+            func.to_char(WorkOrder.created_at, _ISO_TS).label("created_at"),
+            Client.company_name.label("client_company"),
+            (Client.first_name + " " + Client.last_name).label("client_name")
+        ).outerjoin(
+            Client, WorkOrder.client_id == Client.id
+        ).filter(*filters).order_by(
+            WorkOrder.created_at.desc()
+        ).execution_options(stream_results=True).yield_per(batch_size)
+
+        for row in rows:
+            yield row._asdict()
+
     @staticmethod
     async def get_work_order(db: Session, work_order_id: uuid.UUID) -> WorkOrder:
         """Get a specific work order by ID"""
-        work_order = db.query(WorkOrder).filter(WorkOrder.id == work_order_id).first()
+        # Primary-key lookup through Session.get: satisfied straight
+        # from the identity map when the row is already in the session
+        work_order = db.get(WorkOrder, work_order_id)
         
         if not work_order:
             raise NotFoundException(f"Work order with ID {work_order_id} not found")
-        
+
         return work_order
-    
+
+    @staticmethod
+    async def get_work_order_cached(db: Session, work_order_id: uuid.UUID) -> Dict[str, Any]:
+        """Get a work order as a serialized payload, cached in Redis
+
+        Read-through for the GET route: hot work orders are served from
+        cache for up to _WO_CACHE_TTL seconds instead of re-running the
+        single-row SELECT per request. The cache holds the response
+        payload, not the ORM object, so nothing session-bound escapes;
+        mutating paths keep get_work_order and invalidate after commit.
+        """
+        cache_key = _wo_cache_key(work_order_id)
+        cached = await cache_service.get(cache_key)
+        if cached is not None:
+            return cached
+
+        work_order = await WorkOrderService.get_work_order(db, work_order_id)
+        payload = WorkOrderResponse.from_orm(work_order).json()
+        await cache_service.set(cache_key, payload, ttl=_WO_CACHE_TTL)
+        return json.loads(payload)
+
     @staticmethod
     async def create_work_order(db: Session, work_order_data: WorkOrderCreate, user_id: uuid.UUID) -> WorkOrder:
         """Create a new work order with proper transaction handling"""
         # Validate client exists
-        from app.models.client import Client
-        client = db.query(Client).filter(Client.id == work_order_data.client_id).first()
+        client = db.get(Client, work_order_data.client_id)
         if not client:
             raise ValidationException(f"Client with ID {work_order_data.client_id} not found")
-        
+
         # Validate technician if assigned
         if work_order_data.assigned_technician_id:
-            from app.models.technician import Technician
-            technician = db.query(Technician).filter(
-                Technician.id == work_order_data.assigned_technician_id
-            ).first()
-            
+            technician = db.get(Technician, work_order_data.assigned_technician_id)
+
             if not technician:
                 raise ValidationException(f"Technician with ID {work_order_data.assigned_technician_id} not found")
         
-        # Generate unique order number
-        from app.models.settings import Settings
-        settings = db.query(Settings).filter(Settings.key == "work_order_settings").first()
-        
-        if settings:
-            work_order_settings = settings.value
-            prefix = work_order_settings.get("auto_number_prefix", "WO-")
-            next_number = work_order_settings.get("auto_number_start", 1001)
-            
-            # Find the latest work order number
-            latest_work_order = db.query(WorkOrder).order_by(WorkOrder.order_number.desc()).first()
-            
-            if latest_work_order and latest_work_order.order_number.startswith(prefix):
-                try:
-                    last_number = int(latest_work_order.order_number[len(prefix):])
-                    next_number = last_number + 1
-                except (ValueError, TypeError):
-                    pass
-            
-            order_number = f"{prefix}{next_number}"
-            
-            # Update the setting
-            work_order_settings["auto_number_start"] = next_number + 1
-            settings.value = work_order_settings
-        else:
-            # Fallback if settings not found
-            import random
-            order_number = f"WO-{random.randint(1000, 9999)}"
+        # Generate a unique order number from an atomic sequence: one
+        # round-trip, safe under concurrent creates, and no ORDER BY
+        # scan over work_orders or read-modify-write of the settings JSON
+        prefix = _order_number_prefix(db)
+        next_number = db.execute(text("SELECT nextval('work_order_number_seq')")).scalar()
+        order_number = f"{prefix}{next_number}"
         
         try:
             # Begin transaction
@@ -135,72 +281,95 @@ class WorkOrderService:
             db.add(new_work_order)
             db.flush()  # Flush to get the ID without committing
             
-            # If assigned to technician, update status and create history
+            # If assigned to technician, update the status; the status
+            # trigger records the pending -> scheduled transition with
+            # the note passed through the transaction-local setting
             if new_work_order.assigned_technician_id:
                 new_work_order.status = "scheduled"
-                
-                # Create status history
-                status_history = WorkOrderStatusHistory(
-                    work_order_id=new_work_order.id,
-                    previous_status="pending",
-                    new_status="scheduled",
-                    changed_by=user_id,
-                    notes="Initial assignment"
+                new_work_order.updated_by = user_id
+                db.execute(
+                    text("SELECT set_config('app.status_notes', 'Initial assignment', true)")
                 )
-                db.add(status_history)
             
             # Add services if provided
             if work_order_data.services:
+                # Validate and price all services with one IN query
+                # instead of a SELECT per service
+                service_ids = [s.service_id for s in work_order_data.services]
+                services_by_id = {
+                    s.id: s
+                    for s in db.query(Service).filter(Service.id.in_(service_ids)).all()
+                }
+
+                service_rows = []
                 for service_data in work_order_data.services:
-                    # Validate service exists
-                    from app.models.service import Service
-                    service = db.query(Service).filter(Service.id == service_data.service_id).first()
+                    service = services_by_id.get(service_data.service_id)
                     if not service:
                         raise ValidationException(f"Service with ID {service_data.service_id} not found")
-                    
-                    service_item = WorkOrderServiceModel(
-                        work_order_id=new_work_order.id,
-                        service_id=service_data.service_id,
-                        quantity=service_data.quantity,
-                        price=service_data.price or service.base_price,
-                        notes=service_data.notes
-                    )
-                    db.add(service_item)
+
+                    service_rows.append({
+                        "work_order_id": new_work_order.id,
+                        "service_id": service_data.service_id,
+                        "quantity": service_data.quantity,
+                        "price": service_data.price or service.base_price,
+                        "notes": service_data.notes
+                    })
+
+                # Plain link rows: insert them in one batch without
+                # per-object unit-of-work bookkeeping
+                db.bulk_insert_mappings(WorkOrderServiceModel, service_rows)
             
             # Add inventory items if provided
             if work_order_data.items:
+                # Same batching for inventory: one IN query for every
+                # referenced item, validated against the map in memory
+                item_ids = [i.inventory_item_id for i in work_order_data.items]
+                items_by_id = {
+                    i.id: i
+                    for i in db.query(InventoryItem).filter(InventoryItem.id.in_(item_ids)).all()
+                }
+
+                item_rows = []
                 for item_data in work_order_data.items:
-                    # Validate inventory item exists
-                    from app.models.inventory import InventoryItem
-                    inv_item = db.query(InventoryItem).filter(
-                        InventoryItem.id == item_data.inventory_item_id
-                    ).first()
-                    
+                    inv_item = items_by_id.get(item_data.inventory_item_id)
+
                     if not inv_item:
                         raise ValidationException(f"Inventory item with ID {item_data.inventory_item_id} not found")
-                    
+
                     # Check if enough quantity is available
                     if inv_item.quantity_in_stock < item_data.quantity:
                         raise ConflictException(
                             f"Not enough {inv_item.name} in stock. Available: {inv_item.quantity_in_stock}"
                         )
-                    
-                    work_order_item = WorkOrderItem(
-                        work_order_id=new_work_order.id,
-                        inventory_item_id=item_data.inventory_item_id,
-                        quantity=item_data.quantity,
-                        price=item_data.price or inv_item.unit_price,
-                        notes=item_data.notes
-                    )
-                    db.add(work_order_item)
+
+                    item_rows.append({
+                        "work_order_id": new_work_order.id,
+                        "inventory_item_id": item_data.inventory_item_id,
+                        "quantity": item_data.quantity,
+                        "price": item_data.price or inv_item.unit_price,
+                        "notes": item_data.notes
+                    })
+
+                db.bulk_insert_mappings(WorkOrderItem, item_rows)
             
             # Commit the transaction
             db.commit()
             db.refresh(new_work_order)
-            
-            # Schedule notifications in background
-            await WorkOrderService._schedule_notifications(db, new_work_order)
-            
+
+            # A scheduled assignment books a slot; drop the cached slot
+            # timelines so available-slots reflects it immediately.
+            # Imported here to avoid a circular import with the
+            # scheduling service.
+            if new_work_order.assigned_technician_id and new_work_order.scheduled_start:
+                from app.services.scheduling_service import _invalidate_slot_cache
+                await _invalidate_slot_cache(new_work_order.assigned_technician_id)
+
+            # Fan out notifications from a Celery worker; enqueued after
+            # the commit so the task cannot race an uncommitted row, and
+            # the request path pays only for the enqueue
+            from app.background.tasks.notifications import notify_work_order_created
+            notify_work_order_created.delay(str(new_work_order.id))
+
             return new_work_order
             
         except SQLAlchemyError as e:
@@ -225,48 +394,67 @@ class WorkOrderService:
         if work_order.status in ["completed", "cancelled"]:
             raise ConflictException(f"Cannot update a work order with status {work_order.status}")
         
-        # Validate technician if assigned
+        # Validate technician if assigned: an id-only existence probe,
+        # no full ORM hydration of the technician row
         if work_order_data.assigned_technician_id:
-            from app.models.technician import Technician
-            technician = db.query(Technician).filter(
+            technician_exists = db.query(Technician.id).filter(
                 Technician.id == work_order_data.assigned_technician_id
-            ).first()
-            
-            if not technician:
+            ).scalar()
+
+            if not technician_exists:
                 raise ValidationException(f"Technician with ID {work_order_data.assigned_technician_id} not found")
-        
+
         try:
-            # Begin transaction
-            update_data = work_order_data.dict(exclude_unset=True)
-            
-            # If status is changing, create status history
-            if "status" in update_data and update_data["status"] != work_order.status:
-                # Create status history record
-                status_history = WorkOrderStatusHistory(
-                    work_order_id=work_order.id,
-                    previous_status=work_order.status,
-                    new_status=update_data["status"],
-                    changed_by=update_data.get("updated_by", work_order.created_by),
-                    notes=update_data.get("status_notes", "Status updated")
-                )
-                db.add(status_history)
-                
+            # Read the explicitly-set fields straight off the model;
+            # skipping .dict(exclude_unset=True) avoids the deep copy
+            # of nested values it performs on every update
+            fields_set = work_order_data.__fields_set__
+            new_status = work_order_data.status if "status" in fields_set else None
+            previous_technician_id = work_order.assigned_technician_id
+
+            # If status is changing, the AFTER UPDATE trigger on
+            # work_orders writes the history row server-side; only the
+            # audit fields it reads need to be threaded through
+            if new_status is not None and new_status != work_order.status:
+                if "updated_by" in fields_set and work_order_data.updated_by:
+                    work_order.updated_by = work_order_data.updated_by
+                else:
+                    work_order.updated_by = work_order.created_by
+                if "status_notes" in fields_set and work_order_data.status_notes:
+                    db.execute(
+                        text("SELECT set_config('app.status_notes', :notes, true)"),
+                        {"notes": work_order_data.status_notes}
+                    )
+
                 # Set timestamps based on status
-                if update_data["status"] == "in_progress" and not work_order.actual_start:
+                if new_status == "in_progress" and not work_order.actual_start:
                     work_order.actual_start = datetime.utcnow()
-                elif update_data["status"] == "completed" and not work_order.actual_end:
+                elif new_status == "completed" and not work_order.actual_end:
                     work_order.actual_end = datetime.utcnow()
-            
+
             # Update the work order with provided fields
-            for key, value in update_data.items():
-                if key not in ["updated_by", "status_notes"]:
-                    setattr(work_order, key, value)
+            for key in fields_set:
+                if key not in ("updated_by", "status_notes"):
+                    setattr(work_order, key, getattr(work_order_data, key))
             
             db.commit()
             db.refresh(work_order)
-            
+
+            # Drop the cached payload so readers see the new state
+            await cache_service.delete(_wo_cache_key(work_order_id))
+
+            # Assignment, window, or status changes alter the booked
+            # timeline; drop the affected technicians' cached slots.
+            # Imported here to avoid a circular import with the
+            # scheduling service.
+            if fields_set & {"assigned_technician_id", "scheduled_start", "scheduled_end", "status"}:
+                from app.services.scheduling_service import _invalidate_slot_cache
+                for tech_id in {previous_technician_id, work_order.assigned_technician_id}:
+                    if tech_id:
+                        await _invalidate_slot_cache(tech_id)
+
             return work_order
-            
+
         except SQLAlchemyError as e:
             db.rollback()
             logger.error(f"Database error updating work order: {str(e)}")
@@ -286,34 +474,33 @@ class WorkOrderService:
             raise ConflictException(f"Cannot delete a work order with status {work_order.status}")
         
         try:
-            # Check if there are invoices related to this work order
-            from app.models.invoice import Invoice
-            invoice = db.query(Invoice).filter(Invoice.work_order_id == work_order_id).first()
-            
-            if invoice:
+            # EXISTS probe for related invoices: one boolean over the
+            # wire instead of hydrating a full invoice row
+            has_invoice = db.query(
+                db.query(Invoice).filter(
+                    Invoice.work_order_id == work_order_id
+                ).exists()
+            ).scalar()
+
+            if has_invoice:
                 raise ConflictException("Cannot delete work order with associated invoices")
-            
-            # Delete associated records
-            db.query(WorkOrderStatusHistory).filter(
-                WorkOrderStatusHistory.work_order_id == work_order_id
-            ).delete()
-            
-            db.query(WorkOrderServiceModel).filter(
-                WorkOrderServiceModel.work_order_id == work_order_id
-            ).delete()
-            
-            db.query(WorkOrderItem).filter(
-                WorkOrderItem.work_order_id == work_order_id
-            ).delete()
-            
-            db.query(WorkOrderNote).filter(
-                WorkOrderNote.work_order_id == work_order_id
-            ).delete()
-            
-            # Delete the work order
+
+            # Delete the work order; the child rows (services, items,
+            # notes, status history) go with it via ON DELETE CASCADE,
+            # so one statement replaces the four explicit child deletes
+            technician_id = work_order.assigned_technician_id
             db.delete(work_order)
             db.commit()
-            
+
+            await cache_service.delete(_wo_cache_key(work_order_id))
+
+            # Deleting a scheduled order frees its slot; drop the
+            # technician's cached slot timelines. Imported here to
+            # avoid a circular import with the scheduling service.
+            if technician_id:
+                from app.services.scheduling_service import _invalidate_slot_cache
+                await _invalidate_slot_cache(technician_id)
+
             return True
             
         except ConflictException:
@@ -330,21 +517,20 @@ class WorkOrderService:
     @staticmethod
     async def _schedule_notifications(db: Session, work_order: WorkOrder) -> None:
         """Schedule notifications for work order events"""
-        # Import here to avoid circular imports
+        # Imported here to avoid a circular import with the notification service
         from app.services.notification_service import NotificationService
-        from app.models.client import Client
-        from app.models.user import User
-        from app.models.technician import Technician
-        from app.schemas.notification import NotificationCreate
         
         try:
-            # Notify client about new work order
+            # Notify client about new work order; only the user_id is
+            # needed, so fetch it as a scalar instead of the full row
             if work_order.client_id:
-                client = db.query(Client).filter(Client.id == work_order.client_id).first()
-                
-                if client and client.user_id:
+                client_user_id = db.query(Client.user_id).filter(
+                    Client.id == work_order.client_id
+                ).scalar()
+
+                if client_user_id:
                     client_notification = NotificationCreate(
-                        user_id=client.user_id,
+                        user_id=client_user_id,
                         title="New Work Order Created",
                         content=f"A new work order #{work_order.order_number} has been created for you",
                         type="in_app",
@@ -356,13 +542,13 @@ class WorkOrderService:
             
             # Notify technician if assigned
             if work_order.assigned_technician_id:
-                technician = db.query(Technician).filter(
+                tech_user_id = db.query(Technician.user_id).filter(
                     Technician.id == work_order.assigned_technician_id
-                ).first()
-                
-                if technician and technician.user_id:
+                ).scalar()
+
+                if tech_user_id:
                     tech_notification = NotificationCreate(
-                        user_id=technician.user_id,
+                        user_id=tech_user_id,
                         title="New Job Assignment",
                         content=f"You have been assigned to work order #{work_order.order_number}",
                         type="in_app",
@@ -374,22 +560,26 @@ class WorkOrderService:
                     
                     # Schedule reminders if work order is scheduled
                     if work_order.scheduled_start:
+                        from celery import group
                         from app.background.tasks.reminders import schedule_appointment_reminder
-                        
-                        # Schedule reminders for 24 hours and 1 hour before appointment
-                        schedule_appointment_reminder.delay(
-                            work_order_id=str(work_order.id),
-                            user_id=str(technician.user_id),
-                            scheduled_time=work_order.scheduled_start.isoformat(),
-                            hours_before=24
-                        )
-                        
-                        schedule_appointment_reminder.delay(
-                            work_order_id=str(work_order.id),
-                            user_id=str(technician.user_id),
-                            scheduled_time=work_order.scheduled_start.isoformat(),
-                            hours_before=1
-                        )
+
+                        # Serialize the shared arguments once; both
+                        # signatures reuse the same strings
+                        wo_id = str(work_order.id)
+                        uid = str(tech_user_id)
+                        scheduled_iso = work_order.scheduled_start.isoformat()
+
+                        # Enqueue the 24 hour and 1 hour reminders as one
+                        # group: a single broker publish for both tasks
+                        group(
+                            schedule_appointment_reminder.s(
+                                work_order_id=wo_id,
+                                user_id=uid,
+                                scheduled_time=scheduled_iso,
+                                hours_before=hours
+                            )
+                            for hours in (24, 1)
+                        ).apply_async()
         except Exception as e:
             # Log error but don't fail the work order creation
             logger.error(f"Error scheduling notifications: {str(e)}")
\ No newline at end of file